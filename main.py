@@ -7,32 +7,37 @@ This is the main CLI entry point. GOrchestrator is a conversational
 tasks to the Worker Agent (Mini-SWE-GOCore).
 """
 
-import io
 import logging
 import sys
 from pathlib import Path
 
 
+def _is_utf8(stream) -> bool:
+    """Return True if a text stream already encodes as UTF-8."""
+    encoding = getattr(stream, "encoding", None) or ""
+    return encoding.lower().replace("-", "").replace("_", "") == "utf8"
+
+
 def configure_encoding():
     """
     Force UTF-8 encoding on Windows to prevent charmap errors.
     Must be called before any output is written.
     """
     if sys.platform == "win32":
-        # Reconfigure stdout and stderr to use UTF-8
-        if hasattr(sys.stdout, "reconfigure"):
-            sys.stdout.reconfigure(encoding="utf-8", errors="replace")
-        else:
-            sys.stdout = io.TextIOWrapper(
-                sys.stdout.buffer, encoding="utf-8", errors="replace"
-            )
-
-        if hasattr(sys.stderr, "reconfigure"):
-            sys.stderr.reconfigure(encoding="utf-8", errors="replace")
-        else:
-            sys.stderr = io.TextIOWrapper(
-                sys.stderr.buffer, encoding="utf-8", errors="replace"
-            )
+        # Reconfigure stdout and stderr to use UTF-8, skipping streams that
+        # already are (e.g. Windows Terminal, PYTHONUTF8=1)
+        for name in ("stdout", "stderr"):
+            stream = getattr(sys, name)
+            if _is_utf8(stream):
+                continue
+            if hasattr(stream, "reconfigure"):
+                stream.reconfigure(encoding="utf-8", errors="replace")
+            else:
+                # Replaced stream without reconfigure(): wrap its buffer
+                import io
+                setattr(sys, name, io.TextIOWrapper(
+                    stream.buffer, encoding="utf-8", errors="replace"
+                ))
 
         # Also set environment variable for child processes
         import os
@@ -42,30 +47,139 @@ def configure_encoding():
 # Configure encoding FIRST, before any imports that might print
 configure_encoding()
 
-from src.core import SessionEngine, get_settings
+_USAGE = """\
+usage: python main.py [-h] [--version] [-c PROMPT]
 
+GOrchestrator - Intelligent AI Agent Manager.
+Starts an interactive session with the Manager Agent.
 
-def main():
-    """Main entry point - start interactive session with Manager Agent."""
-    # Configure logging - file only, no console noise
-    log_dir = Path(__file__).parent / ".gorchestrator"
+options:
+  -h, --help            show this help message and exit
+  --version             show program's version number and exit
+  -c, --prompt PROMPT   answer a single prompt non-interactively and print
+                        the Manager's reply (no UI, no session files)
+"""
+
+
+def _print_version():
+    """Print the installed package version (metadata lookup only on this path)."""
+    from importlib.metadata import PackageNotFoundError, version
+    try:
+        print(f"gorchestrator {version('gorchestrator')}")
+    except PackageNotFoundError:
+        print("gorchestrator (unknown version)")
+
+
+def _configure_logging(log_dir: Path):
+    """Configure file-only logging and silence noisy third-party loggers.
+
+    The log file is opened lazily (``delay=True``) on the first emitted record,
+    and ``getLogger`` only registers names, so nothing here imports litellm/httpx.
+    """
     log_dir.mkdir(parents=True, exist_ok=True)
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s [%(name)s] %(levelname)s: %(message)s",
         handlers=[
-            logging.FileHandler(log_dir / "gorchestrator.log", encoding="utf-8"),
+            logging.FileHandler(log_dir / "gorchestrator.log", encoding="utf-8", delay=True),
         ],
     )
-    # Suppress noisy third-party loggers
+    _quiet_third_party_loggers()
+
+
+def _quiet_third_party_loggers():
+    """Suppress noisy third-party loggers."""
     logging.getLogger("litellm").setLevel(logging.ERROR)
     logging.getLogger("LiteLLM").setLevel(logging.ERROR)
     logging.getLogger("LiteLLM Proxy").setLevel(logging.ERROR)
     logging.getLogger("httpx").setLevel(logging.WARNING)
     logging.getLogger("httpcore").setLevel(logging.WARNING)
 
+
+def _prompt_index(args: list[str]) -> int:
+    """Return the index of the -c/--prompt flag, or len(args) if not given.
+
+    Only the arguments before it are options: the prompt after it may itself
+    look like one (``-c "--help me"``).
+    """
+    for i, arg in enumerate(args):
+        if arg in ("-c", "--prompt") or arg.startswith("--prompt="):
+            return i
+    return len(args)
+
+
+def _prompt_arg(args: list[str]) -> str | None:
+    """Return the value of -c/--prompt, or None if not given.
+
+    Raises ValueError if the flag has no value.
+    """
+    for i, arg in enumerate(args):
+        if arg.startswith("--prompt="):
+            return arg[len("--prompt="):]
+        if arg in ("-c", "--prompt"):
+            if i + 1 >= len(args):
+                raise ValueError(f"argument {arg}: expected one argument")
+            return args[i + 1]
+    return None
+
+
+def _run_prompt(prompt: str) -> int:
+    """Send one prompt to the Manager and print its reply as plain text.
+
+    Skips SessionEngine, ConsoleUI/rich and session persistence. Worker and
+    sub-manager registries are only read, so nothing is written to .gorchestrator/.
+    """
+    from src.core.config import get_settings
+    from src.core.manager import ManagerAgent
+    from src.core.sub_manager import SubManagerRegistry
+    from src.core.worker_registry import WorkerRegistry
+
+    _quiet_third_party_loggers()
+    state_dir = Path(__file__).parent / ".gorchestrator"
+    manager = ManagerAgent(
+        settings=get_settings(),
+        worker_registry=WorkerRegistry(state_dir / "workers.json"),
+        sub_manager_registry=SubManagerRegistry(state_dir / "sub_managers.json"),
+    )
+    response = manager.chat(prompt)
+    if response.content:
+        print(response.content)
+    return 0
+
+
+def main(argv: list[str] | None = None):
+    """Main entry point - start interactive session with Manager Agent."""
+    args = sys.argv[1:] if argv is None else argv
+
+    # Fast exit paths: no settings, logging or SessionEngine import needed
+    end = _prompt_index(args)
+    options = args[:end]
+    if "-h" in options or "--help" in options:
+        print(_USAGE, end="")
+        return 0
+    if "--version" in options:
+        _print_version()
+        return 0
     try:
+        prompt = _prompt_arg(args[end:])
+    except ValueError as e:
+        print(f"{_USAGE.splitlines()[0]}\nmain.py: error: {e}", file=sys.stderr)
+        return 2
+
+    if prompt is not None:
+        try:
+            return _run_prompt(prompt)
+        except KeyboardInterrupt:
+            return 130
+        except Exception as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+
+    try:
+        from src.core import SessionEngine, get_settings
+
         settings = get_settings()
+        _configure_logging(Path(__file__).parent / ".gorchestrator")
         engine = SessionEngine(settings=settings)
         engine.start_interactive_mode()
         return 0
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Precompile GOrchestrator to hash-based .pyc files (PEP 552).
+
+Run this once per install/upgrade to take source compilation off the cold
+start path:
+
+    uv run python precompile.py              # checked-hash (default)
+    uv run python precompile.py --unchecked  # unchecked-hash (frozen deployments)
+
+Checked-hash .pyc files are revalidated against the source hash on import,
+so they stay correct after a git pull or a local edit. Unchecked-hash files
+are used without looking at the source again and go stale as soon as a file
+changes -- only use --unchecked for installs whose sources never change.
+
+Only src/ is compiled: a script run as ``python main.py`` is always compiled
+from source, so a cached .pyc for it would never be used.
+"""
+
+import argparse
+import compileall
+import py_compile
+import sys
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parent
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Precompile GOrchestrator sources.")
+    parser.add_argument(
+        "--unchecked",
+        action="store_true",
+        help="write unchecked-hash .pyc files (stale after any source change)",
+    )
+    args = parser.parse_args(argv)
+
+    mode = (
+        py_compile.PycInvalidationMode.UNCHECKED_HASH
+        if args.unchecked
+        else py_compile.PycInvalidationMode.CHECKED_HASH
+    )
+    ok = compileall.compile_dir(_ROOT / "src", quiet=1, force=True, invalidation_mode=mode)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
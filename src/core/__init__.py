@@ -1,4 +1,10 @@
 # Core module - Configuration, Worker, Manager, and Engine components
+#
+# Configuration helpers are imported eagerly (cheap). Everything else pulls in
+# litellm, rich and the worker/manager stack, so those names are resolved
+# lazily on first attribute access (PEP 562).
+import importlib
+
 from .config import (
     Settings,
     detect_provider,
@@ -7,10 +13,19 @@ from .config import (
     strip_provider_prefix,
     write_env_value,
 )
-from .engine import SessionEngine, SessionMode
-from .worker_registry import WorkerConfig, WorkerRegistry
-from .manager import ManagerAgent, ManagerResponse
-from .worker import AgentWorker, TaskResult, TaskStatus
+
+# Public name -> (submodule, attribute)
+_LAZY: dict[str, tuple[str, str]] = {
+    "AgentWorker": (".worker", "AgentWorker"),
+    "TaskResult": (".worker", "TaskResult"),
+    "TaskStatus": (".worker", "TaskStatus"),
+    "ManagerAgent": (".manager", "ManagerAgent"),
+    "ManagerResponse": (".manager", "ManagerResponse"),
+    "SessionEngine": (".engine", "SessionEngine"),
+    "SessionMode": (".engine", "SessionMode"),
+    "WorkerConfig": (".worker_registry", "WorkerConfig"),
+    "WorkerRegistry": (".worker_registry", "WorkerRegistry"),
+}
 
 __all__ = [
     "Settings",
@@ -29,3 +44,18 @@ __all__ = [
     "WorkerConfig",
     "WorkerRegistry",
 ]
+
+
+def __getattr__(name: str):
+    """Resolve heavy public names on first access and cache them in the module."""
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -9,10 +9,12 @@ import atexit
 import logging
 import re
 import threading
+from collections.abc import Mapping
 from concurrent.futures import ThreadPoolExecutor
-from functools import lru_cache  # kept for backward compat if used elsewhere
+from functools import cached_property
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, ClassVar
 
 import yaml
 from pydantic import Field
@@ -239,6 +241,9 @@ _ENV_FILE = _PROJECT_ROOT / ".env"
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
 
+    # Not frozen: the singleton is updated in place by reload_settings() and
+    # runtime overrides (/model, /manager ...). validate_assignment stays off,
+    # so attribute writes are not re-validated.
     model_config = SettingsConfigDict(
         env_file=str(_ENV_FILE),
         env_file_encoding="utf-8",
@@ -347,30 +352,57 @@ class Settings(BaseSettings):
         description="Maximum time in seconds for a Worker task before timeout (0 = no timeout)",
     )
 
+    WORKER_MAX_KEPT_LINES: int = Field(
+        default=1000,
+        description="Most recent Worker output lines kept per task result (0 = keep all)",
+    )
+
+    WORKER_CACHE_TTL: int = Field(
+        default=0,
+        description="Seconds to reuse a successful Worker result for an identical delegation (0 = disabled)",
+    )
+
     MAX_CONVERSATION_MESSAGES: int = Field(
         default=100,
         description="Maximum number of messages to keep in conversation history (system message excluded)",
     )
 
-    @property
+    # Derived values cached on first access; dropped when a source field changes
+    _CACHED_DERIVED: ClassVar[dict[str, tuple[str, ...]]] = {
+        "AGENT_PATH": ("agent_path_resolved",),
+        "PROXY_URL": ("agent_env",),
+        "PROXY_KEY": ("agent_env",),
+    }
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        for cached in self._CACHED_DERIVED.get(name, ()):
+            self.__dict__.pop(cached, None)
+
+    @cached_property
     def agent_path_resolved(self) -> Path:
-        """Return the resolved absolute path to the agent folder."""
+        """Return the resolved absolute path to the agent folder (cached)."""
         path = Path(self.AGENT_PATH)
         if not path.is_absolute():
             path = Path.cwd() / path
         return path.resolve()
 
-    def get_agent_env(self) -> dict[str, str]:
-        """Build environment variables for the Worker subprocess.
+    @cached_property
+    def agent_env(self) -> Mapping[str, str]:
+        """Read-only environment variables for the Worker subprocess (cached).
 
         Only MINI_API_BASE and MINI_API_KEY are needed.
         LiteLLM in Mini-SWE-GOCore handles provider routing natively.
         """
         proxy = self.PROXY_URL.rstrip("/")
-        return {
+        return MappingProxyType({
             "MINI_API_BASE": proxy,
             "MINI_API_KEY": self.PROXY_KEY,
-        }
+        })
+
+    def get_agent_env(self) -> dict[str, str]:
+        """Build environment variables for the Worker subprocess (mutable copy of agent_env)."""
+        return dict(self.agent_env)
 
     def get_manager_config(self) -> dict[str, Any]:
         """
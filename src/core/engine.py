@@ -11,13 +11,12 @@ import random
 import re
 import subprocess
 import uuid
+from collections import OrderedDict
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
-from ..ui.console import ConsoleUI
-from ..utils.parser import parse_log_line
 from .config import Settings, get_settings, reload_settings, write_env_value, _SUB_MANAGER_PROFILES_DIR
 from .manager import ManagerAgent, ManagerResponse
 from .sub_manager import SubManagerConfig, SubManagerRegistry, SubManagerResponse
@@ -35,6 +34,65 @@ from ..commands.help import HelpSystem
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson  # Optional: faster session (de)serialization
+except ImportError:
+    orjson = None
+
+
+def _read_json_file(path: Path) -> Any:
+    """Read and parse a whole JSON file in one read (orjson if available).
+
+    Raises json.JSONDecodeError on malformed content (orjson's error subclasses it).
+    """
+    data = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _write_json_file(path: Path, data: Any) -> None:
+    """Serialize data as indented UTF-8 JSON.
+
+    orjson encodes and writes in one call; the stdlib fallback streams
+    iterencode() chunks through a buffered binary file so the whole document
+    is never held as one str. The file is written next to its target and
+    moved into place, so a crash never leaves a truncated file behind.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    if orjson is not None:
+        tmp.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+        with open(tmp, "wb") as f:
+            for chunk in encoder.iterencode(data):
+                f.write(chunk.encode("utf-8"))
+    os.replace(tmp, path)
+
+
+def _json_line(data: Any) -> bytes:
+    """Serialize data as a single compact JSON Lines record."""
+    if orjson is not None:
+        return orjson.dumps(data) + b"\n"
+    return json.dumps(data, ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+def _read_json_lines(path: Path) -> list:
+    """Read a JSON Lines file, skipping blank and malformed records.
+
+    A torn final line (e.g. the process died mid-append) is dropped rather than
+    failing the whole load.
+    """
+    records = []
+    for line in path.read_bytes().splitlines():
+        if not line.strip():
+            continue
+        try:
+            records.append(orjson.loads(line) if orjson is not None else json.loads(line))
+        except json.JSONDecodeError:
+            logger.warning(f"Skipping malformed journal record in {path}")
+    return records
+
 
 # Random session name components
 _NAME_ADJECTIVES = [
@@ -50,6 +108,112 @@ _NAME_NOUNS = [
 ]
 
 
+_HELP_TEXT = """
+## GOrchestrator - Intelligent AI Agent Manager
+
+### How It Works
+You chat with the **Manager Agent**, a Senior Software Architect AI.
+The Manager understands your requests and decides when to delegate tasks
+to the **Worker Agent**, which executes code and terminal commands.
+
+### Session Commands
+| Command | Alias | Description |
+|---------|-------|-------------|
+| `/save [name]` | `/s` | Save current session |
+| `/load [id or name]` | | Load session by ID or name (shows list if no arg) |
+| `/list` | `/l` | List all saved sessions |
+| `/new [name]` | | Start a new session (random name if omitted) |
+| `/clear` | | Clear conversation and start new session |
+| `/clearterminal` | `/ct` | Clear terminal screen only |
+| `/history` | | Show full conversation history |
+
+### Display Commands
+| Command | Description |
+|---------|-------------|
+| `/verbose` | Show detailed Worker output |
+| `/quiet` | Show summarized Worker output |
+
+### Config Commands
+| Command | Description |
+|---------|-------------|
+| `/model [manager\\|worker] <name>` | Change model (saved to .env) |
+| `/config show` | Show current configuration |
+| `/config reload` | Reload .env file |
+| `/config validate` | Check config for issues |
+| `/config set <KEY> <VALUE>` | Set a config value (saved to .env) |
+
+### Worker Management
+| Command | Alias | Description |
+|---------|-------|-------------|
+| `/worker list` | `/w list` | List all worker profiles |
+| `/worker add <name> [model] [profile]` | | Add a new worker |
+| `/worker remove <name>` | | Remove a worker |
+| `/worker set <name> active` | | Activate a worker (multiple can be active) |
+| `/worker set <name> inactive` | | Deactivate a worker |
+| `/worker set <name> primary` | | Set as primary worker (.env sync) |
+| `/worker show <name>` | | Show worker details (model, profile, API, tool) |
+| `/worker model <name> <model>` | | Change a worker's model |
+| `/worker profile <name> <profile>` | | Change a worker's profile |
+| `/worker api <name> <url> [key]` | | Set per-worker API endpoint |
+
+### Config Aliases
+- `/config set manager <model>` → sets ORCHESTRATOR_MODEL
+- `/config set worker <model>` → sets WORKER_MODEL
+
+### Multi-Worker
+- Multiple workers can be **active** simultaneously
+- The **primary** worker's settings are written to `.env`
+- Manager can delegate to multiple workers in parallel
+- Manager chooses which worker(s) to use based on the task
+- Each worker can have its own API endpoint (`/worker api`)
+
+### Safety Commands
+| Command | Description |
+|---------|-------------|
+| `/confirm on\\|off` | Ask before Worker executes |
+| `/undo` | Revert last Worker changes (git) |
+| `/checkpoints` | List available git checkpoints |
+
+### Other
+| Command | Alias | Description |
+|---------|-------|-------------|
+| `/help` | `/h` | Show this help |
+| `exit` | `q` | Exit the application |
+
+### Input Tips
+- **Tab**: Autocomplete slash commands and sub-commands
+- **Arrow Up/Down**: Browse input history
+- **Ctrl+J**: Insert new line
+- **Multi-line paste**: Paste multi-line text directly
+"""
+
+# Parsed form of _HELP_TEXT, built on first _show_help() call
+_help_markdown = None
+
+# Classifies LLM errors from their message, checked in priority order: the
+# first kind whose pattern occurs anywhere wins, whatever its position.
+_ERROR_KINDS: tuple[tuple[str, re.Pattern], ...] = (
+    ("conn", re.compile(r"connection|refused", re.IGNORECASE)),
+    ("auth", re.compile(r"auth|401|api_key", re.IGNORECASE)),
+    ("model", re.compile(r"model|404", re.IGNORECASE)),
+)
+
+# User-facing messages per error kind, in priority order. Filled in with the
+# current settings at error time (they can change at runtime via /model).
+_ERROR_TEMPLATES: dict[str, str] = {
+    "connect_error": (
+        "Could not connect to LLM API. "
+        "Make sure the proxy is running at: {api_base}"
+    ),
+    "conn": "Cannot connect to {api_base}. Is the proxy running? Use /config show to check.",
+    "auth": "API key rejected by {api_base}. Check ORCHESTRATOR_API_KEY in .env",
+    "model": (
+        "Model '{model}' not found at {api_base}. "
+        "Use /model to change or /config show to check."
+    ),
+}
+
+
 class SessionMode(Enum):
     """Operating mode for the session."""
     AUTO = "auto"  # Manager runs autonomously
@@ -67,6 +231,16 @@ class SessionEngine:
     _PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
     SESSIONS_DIR = _PROJECT_ROOT / ".gorchestrator" / "sessions"
     _LAST_SESSION_FILE = _PROJECT_ROOT / ".gorchestrator" / "last_session_id"
+    # Per-session append-only log of messages added since session.json was written.
+    # Its first record is a {"journal_seq": n} header; session.json stores the
+    # sequence of the last journal it folded in, so a journal left behind by a
+    # save that died before removing it is recognised and not replayed twice.
+    _JOURNAL_NAME = "journal.jsonl"
+    _SNAPSHOT_EVERY = 20
+    # Fully parsed session files kept for load_session (most recently used last)
+    _SESSION_CACHE_SIZE = 4
+    # session.json fields needed by /list and name lookup
+    _SESSION_META_KEYS = ("session_name", "saved_at", "created_at", "summary", "message_count", "journal_seq")
 
     def __init__(
         self,
@@ -78,6 +252,9 @@ class SessionEngine:
         Args:
             settings: Application settings.
         """
+        # Deferred: rich/prompt_toolkit are only needed once a UI is constructed
+        from ..ui.console import ConsoleUI
+
         self.settings = settings or get_settings()
         self.ui = ConsoleUI(verbose_worker=self.settings.VERBOSE_WORKER)
         self.manager: ManagerAgent | None = None
@@ -91,6 +268,21 @@ class SessionEngine:
         self.session_name: str = ""
         self.session_created_at: str = ""
 
+        # Auto-save journal state: the last message persisted to disk and the
+        # history length at that point, the number of journal appends since
+        # the last full snapshot and the sequence number of the journal that
+        # appends currently go to.
+        self._journal_tail = None
+        self._journal_len = 0
+        self._turns_since_snapshot = 0
+        self._journal_seq = 1
+        # Session ID whose directory is known to exist (skips per-save mkdir)
+        self._dir_ready_for: str | None = None
+        # Parsed session files keyed by path -> (mtime_ns, size, data); treat as read-only.
+        # Full data is an LRU of a few files; listing metadata is kept for every session.
+        self._session_cache: OrderedDict[Path, tuple[int, int, dict]] = OrderedDict()
+        self._session_meta: dict[Path, tuple[int, int, dict]] = {}
+
         # Ensure directories exist
         self.SESSIONS_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -122,6 +314,29 @@ class SessionEngine:
         self.tab_completer = TabCompleter()
         self.help_system = HelpSystem(self)
 
+        # Legacy slash commands: lowercase name -> handler(arg) -> handled
+        self._commands: dict[str, Callable[[str], bool]] = {
+            "/help": self._cmd_help,
+            "/save": self._cmd_save,
+            "/load": self._cmd_load,
+            "/new": self._cmd_new,
+            "/list": self._cmd_list,
+            "/clear": self._cmd_clear,
+            "/clearterminal": self._cmd_clearterminal,
+            "/verbose": self._cmd_verbose,
+            "/quiet": self._cmd_quiet,
+            "/history": self._cmd_history,
+            "/model": self._cmd_model,
+            "/config": self._cmd_config,
+            "/worker": self._cmd_worker,
+            "/submanager": self._cmd_submanager,
+            "/team": self._cmd_team,
+            "/manager": self._cmd_manager,
+            "/confirm": self._cmd_confirm,
+            "/undo": self._cmd_undo,
+            "/checkpoints": self._cmd_checkpoints,
+        }
+
     @property
     def _session_dir(self) -> Path | None:
         """Directory for the current session's data."""
@@ -129,6 +344,14 @@ class SessionEngine:
             return None
         return self.SESSIONS_DIR / self.session_id
 
+    def _ensure_session_dir(self) -> Path:
+        """Return the current session directory, creating it once per session."""
+        session_dir = self._session_dir
+        if self._dir_ready_for != self.session_id:
+            session_dir.mkdir(parents=True, exist_ok=True)
+            self._dir_ready_for = self.session_id
+        return session_dir
+
     def _new_session(self, name: str = "") -> str:
         """Create a new session with a unique ID and optional or random name."""
         self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S") + "_" + uuid.uuid4().hex[:6]
@@ -139,7 +362,10 @@ class SessionEngine:
             adj = random.choice(_NAME_ADJECTIVES)
             noun = random.choice(_NAME_NOUNS)
             self.session_name = f"{adj} {noun}"
-        self._session_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_session_dir()
+        self._journal_tail = None
+        self._journal_len = 0
+        self._journal_seq = 1
         self._save_last_session_id()
         logger.info(f"New session created: {self.session_id}")
         return self.session_id
@@ -147,8 +373,11 @@ class SessionEngine:
     def _save_last_session_id(self):
         """Persist the current session ID so we can resume on restart."""
         try:
-            self._LAST_SESSION_FILE.parent.mkdir(parents=True, exist_ok=True)
-            self._LAST_SESSION_FILE.write_text(self.session_id, encoding="utf-8")
+            try:
+                self._LAST_SESSION_FILE.write_text(self.session_id, encoding="utf-8")
+            except FileNotFoundError:
+                self._LAST_SESSION_FILE.parent.mkdir(parents=True, exist_ok=True)
+                self._LAST_SESSION_FILE.write_text(self.session_id, encoding="utf-8")
         except Exception as e:
             logger.warning(f"Failed to save last session ID: {e}")
 
@@ -220,6 +449,8 @@ class SessionEngine:
 
     def _init_manager(self):
         """Initialize the Manager Agent with UI callbacks."""
+        from ..utils.parser import parse_log_line
+
         def on_worker_output(line: str, worker_name: str = "worker"):
             entry = parse_log_line(line)
             self.ui.display_worker_step(entry, worker_name=worker_name)
@@ -256,8 +487,7 @@ class SessionEngine:
         if not self.session_id:
             self._new_session(name or "")
 
-        session_dir = self._session_dir
-        session_dir.mkdir(parents=True, exist_ok=True)
+        session_dir = self._ensure_session_dir()
         filepath = session_dir / "session.json"
 
         # Build a short summary from last user message
@@ -277,6 +507,7 @@ class SessionEngine:
             "mode": self.mode.value,
             "summary": summary,
             "message_count": len(self.manager.messages) if self.manager else 0,
+            "journal_seq": self._journal_seq,
             "manager_history": self.manager.export_history() if self.manager else [],
         }
 
@@ -285,8 +516,16 @@ class SessionEngine:
             self.session_name = name
 
         try:
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(session_data, f, indent=2, ensure_ascii=False)
+            self._session_cache.pop(filepath, None)
+            self._session_meta.pop(filepath, None)
+            _write_json_file(filepath, session_data)
+            # The snapshot now contains everything the journal held; if this
+            # unlink never happens, load_session skips the journal by its sequence
+            (session_dir / self._JOURNAL_NAME).unlink(missing_ok=True)
+            self._journal_seq += 1
+            self._journal_tail = self.manager.messages[-1] if self.manager and self.manager.messages else None
+            self._journal_len = len(self.manager.messages) if self.manager else 0
+            self._turns_since_snapshot = 0
             self._save_last_session_id()
             logger.info(f"Session saved to {filepath}")
             return filepath
@@ -302,16 +541,25 @@ class SessionEngine:
             return False
 
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                session_data = json.load(f)
+            session_data = self._read_session_file(filepath)
 
             # Ensure manager is initialized
             if not self.manager:
                 self._init_manager()
 
-            # Restore manager history
-            if "manager_history" in session_data:
-                self.manager.import_history(session_data["manager_history"])
+            # Restore manager history (snapshot + journaled messages since)
+            history = session_data.get("manager_history")
+            snapshot_seq = session_data.get("journal_seq", 0)
+            if filepath.name == "session.json":
+                journal = filepath.parent / self._JOURNAL_NAME
+                records = self._journal_records(journal, snapshot_seq)
+                if records is None:
+                    # Already folded into the snapshot; new appends must not join it
+                    journal.unlink(missing_ok=True)
+                else:
+                    history = (history or []) + records
+            if history is not None:
+                self.manager.import_history(history)
 
             # Restore session identity
             self.session_id = session_data.get("session_id", filepath.parent.name)
@@ -327,6 +575,15 @@ class SessionEngine:
                 self.mode = SessionMode.AUTO
                 self.ui.verbose_worker = False
 
+            # A legacy flat file has no session directory to journal into yet:
+            # leaving no tail makes the first auto-save write a full snapshot
+            if filepath.name == "session.json" and self.manager.messages:
+                self._journal_tail = self.manager.messages[-1]
+            else:
+                self._journal_tail = None
+            self._journal_len = len(self.manager.messages)
+            self._turns_since_snapshot = 0
+            self._journal_seq = snapshot_seq + 1
             self._save_last_session_id()
             logger.info(f"Session loaded: {self.session_id}")
             return True
@@ -338,6 +595,22 @@ class SessionEngine:
             logger.error(f"Failed to load session: {e}")
             return False
 
+    def _journal_records(self, journal: Path, snapshot_seq: int) -> list | None:
+        """Return the journaled messages a snapshot does not contain yet.
+
+        Returns None when there is no journal, or when its header sequence is at
+        or below snapshot_seq (the snapshot already holds those messages).
+        """
+        try:
+            records = _read_json_lines(journal)
+        except FileNotFoundError:
+            return None
+        if not records or not isinstance(records[0], dict) or "journal_seq" not in records[0]:
+            return None
+        if records[0]["journal_seq"] <= snapshot_seq:
+            return None
+        return records[1:]
+
     def _find_session_file(self, identifier: str) -> Path | None:
         """Find a session file by ID or name. Returns the file path or None."""
         # Reject path traversal attempts
@@ -357,43 +630,82 @@ class SessionEngine:
 
         # 3. Search by session name (case-insensitive)
         identifier_lower = identifier.lower()
-        for d in self.SESSIONS_DIR.iterdir():
-            if d.is_dir() and (d / "session.json").exists():
+        with os.scandir(self.SESSIONS_DIR) as it:
+            for entry in it:
+                if not entry.is_dir():
+                    continue
+                session_file = Path(entry.path, "session.json")
                 try:
-                    with open(d / "session.json", "r", encoding="utf-8") as fh:
-                        data = json.load(fh)
+                    data = self._read_session_meta(session_file)
                     if data.get("session_name", "").lower() == identifier_lower:
-                        return d / "session.json"
+                        return session_file
                 except Exception:
                     continue
 
         return None
 
+    def _read_session_file(self, path: Path) -> dict:
+        """Parse a session file, reusing the previous result if it is unchanged on disk.
+
+        The returned dict is shared with the cache and must not be mutated.
+        """
+        st = path.stat()
+        cached = self._session_cache.get(path)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            self._session_cache.move_to_end(path)
+            return cached[2]
+        data = _read_json_file(path)
+        self._session_cache[path] = (st.st_mtime_ns, st.st_size, data)
+        self._session_cache.move_to_end(path)
+        if len(self._session_cache) > self._SESSION_CACHE_SIZE:
+            self._session_cache.popitem(last=False)
+        return data
+
+    def _read_session_meta(self, path: Path) -> dict:
+        """Return the listing fields of a session file, reparsing only when it changed on disk."""
+        st = path.stat()
+        cached = self._session_meta.get(path)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        data = _read_json_file(path)
+        meta = {key: data[key] for key in self._SESSION_META_KEYS if key in data}
+        self._session_meta[path] = (st.st_mtime_ns, st.st_size, meta)
+        return meta
+
     def list_sessions(self) -> list[dict]:
         """List all available sessions with metadata."""
+        # os.scandir yields DirEntry objects with cached type/stat info
+        with os.scandir(self.SESSIONS_DIR) as it:
+            entries = sorted(it, key=lambda e: e.stat().st_mtime, reverse=True)
+
         sessions = []
-        # Scan session directories (new format: each session is a directory)
-        for d in sorted(self.SESSIONS_DIR.iterdir(), key=os.path.getmtime, reverse=True):
-            session_file = None
-            if d.is_dir() and (d / "session.json").exists():
-                session_file = d / "session.json"
-                sid = d.name
-            elif d.is_file() and d.suffix == ".json":
+        seen: set[Path] = set()
+        for entry in entries:
+            if entry.is_dir():
+                # New format: each session is a directory
+                session_file = Path(entry.path, "session.json")
+                sid = entry.name
+            elif entry.name.endswith(".json") and entry.is_file():
                 # Legacy flat file
-                session_file = d
-                sid = d.stem
+                session_file = Path(entry.path)
+                sid = entry.name[:-5]
             else:
                 continue
 
             info = {"session_id": sid}
             try:
-                with open(session_file, "r", encoding="utf-8") as fh:
-                    data = json.load(fh)
+                data = self._read_session_meta(session_file)
+                seen.add(session_file)
                 info["name"] = data.get("session_name", sid)
                 info["saved_at"] = data.get("saved_at", "?")
                 info["created_at"] = data.get("created_at", data.get("saved_at", "?"))
                 info["summary"] = data.get("summary", "")[:50]
                 info["messages"] = data.get("message_count", "?")
+                if entry.is_dir():
+                    self._add_journal_info(info, Path(entry.path, self._JOURNAL_NAME), data)
+            except FileNotFoundError:
+                # Directory without a session.json is not a session
+                continue
             except Exception:
                 info["name"] = sid
                 info["saved_at"] = "?"
@@ -401,15 +713,72 @@ class SessionEngine:
                 info["summary"] = "(unreadable)"
                 info["messages"] = "?"
             sessions.append(info)
+
+        # Forget sessions that were removed from disk
+        for path in self._session_meta.keys() - seen:
+            del self._session_meta[path]
+        for path in self._session_cache.keys() - seen:
+            del self._session_cache[path]
         return sessions
 
-    def _auto_save(self):
-        """Automatically save the current session."""
+    def _add_journal_info(self, info: dict, journal: Path, data: dict) -> None:
+        """Bring listing info up to date with messages journaled after the snapshot.
+
+        Journals are not cached: they hold fewer than _SNAPSHOT_EVERY turns and
+        only exist for sessions that did not end with a final snapshot.
+        """
+        records = self._journal_records(journal, data.get("journal_seq", 0))
+        if not records:
+            return
+        if isinstance(info["messages"], int):
+            info["messages"] += len(records)
+        for record in reversed(records):
+            if record.get("role") == "user":
+                info["summary"] = (record.get("content") or "")[:50]
+                break
+        info["saved_at"] = datetime.fromtimestamp(journal.stat().st_mtime).isoformat()
+
+    def _auto_save(self, compact: bool = False):
+        """Automatically save the current session.
+
+        Messages added since the last save are appended to the session journal.
+        A full snapshot is written instead on the first save, every
+        _SNAPSHOT_EVERY appends, when the history was rewritten (trim, clear,
+        load of a legacy file) or when compact=True.
+        """
         try:
-            self.save_session()
+            if compact or not self._append_to_journal():
+                self.save_session()
         except Exception as e:
             logger.warning(f"Auto-save failed: {e}")
 
+    def _append_to_journal(self) -> bool:
+        """Append new messages to the session journal.
+
+        Returns False when a full snapshot is required instead.
+        """
+        if not (self.manager and self.session_id and self._journal_tail is not None):
+            return False
+        if self._turns_since_snapshot + 1 >= self._SNAPSHOT_EVERY:
+            return False
+
+        # The last persisted message must still sit where it was saved: if it
+        # is gone or has moved, messages before it were trimmed or replaced
+        messages = self.manager.messages
+        saved = self._journal_len
+        if saved > len(messages) or messages[saved - 1] is not self._journal_tail:
+            return False
+
+        new_entries = self.manager.export_history(start=saved)
+        if new_entries:
+            with open(self._session_dir / self._JOURNAL_NAME, "ab") as f:
+                header = _json_line({"journal_seq": self._journal_seq}) if f.tell() == 0 else b""
+                f.write(header + b"".join(_json_line(entry) for entry in new_entries))
+            self._journal_tail = messages[-1]
+            self._journal_len = len(messages)
+            self._turns_since_snapshot += 1
+        return True
+
     def _cleanup_executors(self):
         """Shut down all thread pool executors on exit."""
         if hasattr(self, 'manager') and self.manager and hasattr(self.manager, 'shutdown'):
@@ -433,290 +802,300 @@ class SessionEngine:
                 return self.command_handler.handle(cmd_obj)
         
         # Eğer yeni sistemde yoksa eski sistemle dene (backward compatibility)
-        parts = command.strip().split(maxsplit=1)
+        # Split on any whitespace, so a tab or newline also ends the name
+        parts = command.split(None, 1)
+        if not parts:
+            return False
         cmd = parts[0].lower()
-        arg = parts[1] if len(parts) > 1 else ""
+        arg = parts[1].strip() if len(parts) > 1 else ""
 
         # Resolve aliases (consolidated in CommandParser)
         if cmd in CommandParser.ALIASES:
-            resolved = CommandParser.ALIASES[cmd]
             # If alias had no arg, but user passed one, glue it
-            parts2 = resolved.split(maxsplit=1)
-            cmd = parts2[0]
-            if len(parts2) > 1 and not arg:
-                arg = parts2[1]
-
-        # --- Help command ---
-        if cmd == "/help":
-            if arg:
-                # Detaylı yardım
-                return self.help_system.show_command_help(arg)
-            else:
-                # Ana yardım
-                self.help_system.show_main_help()
-                return True
-
-        # --- Session commands ---
-        if cmd == "/save":
-            name = arg.strip() or None
-            try:
-                self.save_session(name)
-                display_name = name or self.session_name
-                self.ui.print_success(f"Session saved: {display_name} (ID: {self.session_id})")
-            except Exception as e:
-                self.ui.print_error(f"Failed to save: {e}")
+            cmd, *alias_arg = CommandParser.ALIASES[cmd].split(None, 1)
+            if alias_arg and not arg:
+                arg = alias_arg[0]
+
+        handler = self._commands.get(cmd)
+        return handler(arg) if handler else False
+
+    def _cmd_help(self, arg: str) -> bool:
+        """Show main help, or detailed help for a command."""
+        if arg:
+            # Detaylı yardım
+            return self.help_system.show_command_help(arg)
+        else:
+            # Ana yardım
+            self.help_system.show_main_help()
             return True
 
-        elif cmd == "/load":
-            identifier = arg.strip()
-            if not identifier:
-                sessions = self.list_sessions()
-                if not sessions:
-                    self.ui.print_info("No saved sessions found.")
-                    return True
-                from rich.table import Table
-                table = Table(title="Available Sessions", show_header=True, header_style="bold cyan")
-                table.add_column("#", style="bold", width=3)
-                table.add_column("ID", style="dim", max_width=22)
-                table.add_column("Name", style="green")
-                table.add_column("Created", style="cyan")
-                table.add_column("Last Modified", style="dim")
-                table.add_column("Messages", style="cyan", justify="right")
-                table.add_column("Summary", style="dim", overflow="fold")
-                for i, s in enumerate(sessions, 1):
-                    created_at = s["created_at"]
-                    last_modified = s["saved_at"]
-                    
-                    # Format dates
-                    if created_at != "?":
-                        try:
-                            dt = datetime.fromisoformat(created_at)
-                            created_at = dt.strftime("%Y-%m-%d %H:%M")
-                        except Exception:
-                            pass
-                    
-                    if last_modified != "?":
-                        try:
-                            dt = datetime.fromisoformat(last_modified)
-                            last_modified = dt.strftime("%Y-%m-%d %H:%M")
-                        except Exception:
-                            pass
-                    
-                    table.add_row(str(i), s["session_id"], s.get("name", ""), 
-                                 created_at, last_modified, str(s["messages"]), s["summary"])
-                self.ui.console.print(table)
-                self.ui.print_info("Usage: /load <session_id or name>")
+    def _cmd_save(self, arg: str) -> bool:
+        """Save the current session, optionally under a new name."""
+        name = arg or None
+        try:
+            self.save_session(name)
+            display_name = name or self.session_name
+            self.ui.print_success(f"Session saved: {display_name} (ID: {self.session_id})")
+        except Exception as e:
+            self.ui.print_error(f"Failed to save: {e}")
+        return True
+
+    def _cmd_load(self, arg: str) -> bool:
+        """Load a session, or list available sessions when no argument is given."""
+        identifier = arg
+        if not identifier:
+            sessions = self.list_sessions()
+            if not sessions:
+                self.ui.print_info("No saved sessions found.")
                 return True
-            if self.load_session(identifier):
-                msg_count = len(self.manager.messages) - 1
-                self.ui.print_success(f"Session '{self.session_name}' loaded ({msg_count} messages)")
-                if self.manager:
-                    history = self.manager.get_history()
-                    recent = history[-5:] if len(history) > 5 else history
-                    if recent:
-                        self.ui.print_info("--- Recent conversation ---")
-                        self.ui.show_history(recent)
-            else:
-                self.ui.print_error(f"Session '{identifier}' not found.")
-                sessions = self.list_sessions()
-                if sessions:
-                    names = [f"{s['session_id']} ({s.get('name', '')})" for s in sessions[:5]]
-                    self.ui.print_info(f"Available: {', '.join(names)}")
-            return True
+            from rich.table import Table
+            table = Table(title="Available Sessions", show_header=True, header_style="bold cyan")
+            table.add_column("#", style="bold", width=3)
+            table.add_column("ID", style="dim", max_width=22)
+            table.add_column("Name", style="green")
+            table.add_column("Created", style="cyan")
+            table.add_column("Last Modified", style="dim")
+            table.add_column("Messages", style="cyan", justify="right")
+            table.add_column("Summary", style="dim", overflow="fold")
+            for i, s in enumerate(sessions, 1):
+                created_at = s["created_at"]
+                last_modified = s["saved_at"]
+
+                # Format dates
+                if created_at != "?":
+                    try:
+                        dt = datetime.fromisoformat(created_at)
+                        created_at = dt.strftime("%Y-%m-%d %H:%M")
+                    except Exception:
+                        pass
 
-        elif cmd == "/new":
-            self._auto_save()
-            self._new_session(arg.strip() or "")
-            if self.manager:
-                self.manager.clear_history()
-            else:
-                self._init_manager()
-            self.ui.print_success(f"New session started: {self.session_name} (ID: {self.session_id})")
-            return True
+                if last_modified != "?":
+                    try:
+                        dt = datetime.fromisoformat(last_modified)
+                        last_modified = dt.strftime("%Y-%m-%d %H:%M")
+                    except Exception:
+                        pass
 
-        elif cmd == "/list":
+                table.add_row(str(i), s["session_id"], s.get("name", ""), 
+                             created_at, last_modified, str(s["messages"]), s["summary"])
+            self.ui.console.print(table)
+            self.ui.print_info("Usage: /load <session_id or name>")
+            return True
+        if self.load_session(identifier):
+            msg_count = len(self.manager.messages) - 1
+            self.ui.print_success(f"Session '{self.session_name}' loaded ({msg_count} messages)")
+            if self.manager:
+                history = self.manager.get_history()
+                recent = history[-5:] if len(history) > 5 else history
+                if recent:
+                    self.ui.print_info("--- Recent conversation ---")
+                    self.ui.show_history(recent)
+        else:
+            self.ui.print_error(f"Session '{identifier}' not found.")
             sessions = self.list_sessions()
             if sessions:
-                from rich.table import Table
-                table = Table(title="Saved Sessions", show_header=True, header_style="bold cyan")
-                table.add_column("ID", style="dim", max_width=22)
-                table.add_column("Name", style="green")
-                table.add_column("Saved At", style="dim")
-                table.add_column("Messages", style="cyan", justify="right")
-                table.add_column("Summary", style="dim", overflow="fold")
-                active_id = self.session_id or ""
-                for s in sessions:
-                    saved_at = s["saved_at"]
-                    if saved_at != "?":
-                        try:
-                            dt = datetime.fromisoformat(saved_at)
-                            saved_at = dt.strftime("%Y-%m-%d %H:%M")
-                        except Exception:
-                            pass
-                    marker = " *" if s["session_id"] == active_id else ""
-                    table.add_row(s["session_id"], s.get("name", "") + marker, saved_at, str(s["messages"]), s["summary"])
-                self.ui.console.print(table)
-                if active_id:
-                    self.ui.print_info(f"Active session: {active_id} (*)")
-            else:
-                self.ui.print_info("No saved sessions found.")
-            return True
+                names = [f"{s['session_id']} ({s.get('name', '')})" for s in sessions[:5]]
+                self.ui.print_info(f"Available: {', '.join(names)}")
+        return True
 
-        elif cmd == "/clear":
-            self._auto_save()
-            self._new_session()
-            if self.manager:
-                self.manager.clear_history()
-            else:
-                self._init_manager()
-            self.ui.clear()
-            self.ui.print_header()
-            self.ui.print_success(f"Conversation cleared. New session: {self.session_name} (ID: {self.session_id})")
-            return True
+    def _cmd_new(self, arg: str) -> bool:
+        """Save the current session and start a new one."""
+        self._auto_save()
+        self._new_session(arg or "")
+        if self.manager:
+            self.manager.clear_history()
+        else:
+            self._init_manager()
+        self.ui.print_success(f"New session started: {self.session_name} (ID: {self.session_id})")
+        return True
 
-        elif cmd == "/clearterminal":
-            self.ui.clear()
-            self.ui.print_header()
-            return True
+    def _cmd_list(self, arg: str) -> bool:
+        """List saved sessions."""
+        sessions = self.list_sessions()
+        if sessions:
+            from rich.table import Table
+            table = Table(title="Saved Sessions", show_header=True, header_style="bold cyan")
+            table.add_column("ID", style="dim", max_width=22)
+            table.add_column("Name", style="green")
+            table.add_column("Saved At", style="dim")
+            table.add_column("Messages", style="cyan", justify="right")
+            table.add_column("Summary", style="dim", overflow="fold")
+            active_id = self.session_id or ""
+            for s in sessions:
+                saved_at = s["saved_at"]
+                if saved_at != "?":
+                    try:
+                        dt = datetime.fromisoformat(saved_at)
+                        saved_at = dt.strftime("%Y-%m-%d %H:%M")
+                    except Exception:
+                        pass
+                marker = " *" if s["session_id"] == active_id else ""
+                table.add_row(s["session_id"], s.get("name", "") + marker, saved_at, str(s["messages"]), s["summary"])
+            self.ui.console.print(table)
+            if active_id:
+                self.ui.print_info(f"Active session: {active_id} (*)")
+        else:
+            self.ui.print_info("No saved sessions found.")
+        return True
 
-        # --- Display mode commands ---
-        elif cmd == "/verbose":
-            self.mode = SessionMode.VERBOSE
-            self.ui.verbose_worker = True
-            self.ui.print_success("Verbose mode enabled. Worker output will be shown in detail.")
-            return True
+    def _cmd_clear(self, arg: str) -> bool:
+        """Save the current session, then clear the conversation and screen."""
+        self._auto_save()
+        self._new_session()
+        if self.manager:
+            self.manager.clear_history()
+        else:
+            self._init_manager()
+        self.ui.clear()
+        self.ui.print_header()
+        self.ui.print_success(f"Conversation cleared. New session: {self.session_name} (ID: {self.session_id})")
+        return True
 
-        elif cmd == "/quiet":
-            self.mode = SessionMode.AUTO
-            self.ui.verbose_worker = False
-            self.ui.print_success("Quiet mode enabled. Worker output will be summarized.")
-            return True
+    def _cmd_clearterminal(self, arg: str) -> bool:
+        """Clear the terminal without touching the session."""
+        self.ui.clear()
+        self.ui.print_header()
+        return True
 
-        elif cmd == "/history":
-            if self.manager:
-                self.ui.show_full_history(self.manager.get_full_history())
-            else:
-                self.ui.print_info("No history yet.")
-            return True
+    def _cmd_verbose(self, arg: str) -> bool:
+        """Show Worker output in detail."""
+        self.mode = SessionMode.VERBOSE
+        self.ui.verbose_worker = True
+        self.ui.print_success("Verbose mode enabled. Worker output will be shown in detail.")
+        return True
 
-        # --- Model command ---
-        elif cmd == "/model":
-            model_name = arg.strip()
-            if not model_name:
-                self.ui.print_info(f"Current Manager model: {self.settings.ORCHESTRATOR_MODEL}")
-                self.ui.print_info(f"Current Worker model: {self.settings.WORKER_MODEL}")
-                self.ui.print_info("Usage: /model <manager|worker> <model_name>")
-                return True
-            parts_model = model_name.split(maxsplit=1)
-            if len(parts_model) == 2 and parts_model[0] in ("manager", "worker"):
-                target, new_model = parts_model
-                if target == "manager":
-                    self.settings.ORCHESTRATOR_MODEL = new_model
-                    write_env_value("ORCHESTRATOR_MODEL", new_model)
-                    self.ui.print_success(f"Manager model changed to: {new_model} (saved to .env)")
-                else:
-                    self.settings.WORKER_MODEL = new_model
-                    write_env_value("WORKER_MODEL", new_model)
-                    # Sync primary worker in registry
-                    primary = self.worker_registry.get_primary()
-                    if primary:
-                        self.worker_registry.update_model(primary.name, new_model)
-                    self._refresh_manager_tools()
-                    self.ui.print_success(f"Worker model changed to: {new_model} (saved to .env)")
-            else:
-                # Default: change manager model
-                self.settings.ORCHESTRATOR_MODEL = model_name
-                write_env_value("ORCHESTRATOR_MODEL", model_name)
-                self.ui.print_success(f"Manager model changed to: {model_name} (saved to .env)")
-            active_workers = self.worker_registry.get_active_workers()
-            active_names = ", ".join(wc.name for wc in active_workers) or "(none)"
-            settings_dict = {
-                "Manager Model": self.settings.ORCHESTRATOR_MODEL,
-                "Worker Model": self.settings.WORKER_MODEL,
-                "Active Workers": active_names,
-                "Agent Path": str(self.settings.agent_path_resolved),
-                "Mode": "Verbose" if self.ui.verbose_worker else "Quiet",
-            }
-            self.ui.print_settings(settings_dict)
-            return True
+    def _cmd_quiet(self, arg: str) -> bool:
+        """Summarize Worker output."""
+        self.mode = SessionMode.AUTO
+        self.ui.verbose_worker = False
+        self.ui.print_success("Quiet mode enabled. Worker output will be summarized.")
+        return True
 
-        # --- Config commands (DEPRECATED) ---
-        elif cmd == "/config":
-            self.ui.print_warning("⚠️  /config command deprecated")
-            self.ui.print_info("")
-            self.ui.print_info("Use /manager or /worker commands instead:")
-            self.ui.print_info("  /manager model <name> [--global]")
-            self.ui.print_info("  /manager api <base> [key] [--global]")
-            self.ui.print_info("  /worker model <name> <model>")
-            self.ui.print_info("  /worker api <name> <base> [key]")
-            return True
+    def _cmd_history(self, arg: str) -> bool:
+        """Show the full conversation history."""
+        if self.manager:
+            self.ui.show_full_history(self.manager.get_full_history())
+        else:
+            self.ui.print_info("No history yet.")
+        return True
 
-        # --- Worker management ---
-        elif cmd == "/worker":
-            self._handle_worker_command(arg.strip())
+    def _cmd_model(self, arg: str) -> bool:
+        """Show or change the Manager/Worker model."""
+        model_name = arg
+        if not model_name:
+            self.ui.print_info(f"Current Manager model: {self.settings.ORCHESTRATOR_MODEL}")
+            self.ui.print_info(f"Current Worker model: {self.settings.WORKER_MODEL}")
+            self.ui.print_info("Usage: /model <manager|worker> <model_name>")
             return True
+        parts_model = model_name.split(maxsplit=1)
+        if len(parts_model) == 2 and parts_model[0] in ("manager", "worker"):
+            target, new_model = parts_model
+            if target == "manager":
+                self.settings.ORCHESTRATOR_MODEL = new_model
+                write_env_value("ORCHESTRATOR_MODEL", new_model)
+                self.ui.print_success(f"Manager model changed to: {new_model} (saved to .env)")
+            else:
+                self.settings.WORKER_MODEL = new_model
+                write_env_value("WORKER_MODEL", new_model)
+                # Sync primary worker in registry
+                primary = self.worker_registry.get_primary()
+                if primary:
+                    self.worker_registry.update_model(primary.name, new_model)
+                self._refresh_manager_tools()
+                self.ui.print_success(f"Worker model changed to: {new_model} (saved to .env)")
+        else:
+            # Default: change manager model
+            self.settings.ORCHESTRATOR_MODEL = model_name
+            write_env_value("ORCHESTRATOR_MODEL", model_name)
+            self.ui.print_success(f"Manager model changed to: {model_name} (saved to .env)")
+        active_workers = self.worker_registry.get_active_workers()
+        active_names = ", ".join(wc.name for wc in active_workers) or "(none)"
+        settings_dict = {
+            "Manager Model": self.settings.ORCHESTRATOR_MODEL,
+            "Worker Model": self.settings.WORKER_MODEL,
+            "Active Workers": active_names,
+            "Agent Path": str(self.settings.agent_path_resolved),
+            "Mode": "Verbose" if self.ui.verbose_worker else "Quiet",
+        }
+        self.ui.print_settings(settings_dict)
+        return True
 
-        # --- Sub-manager management ---
-        elif cmd == "/submanager":
-            self._handle_submanager_command(arg.strip())
-            return True
+    def _cmd_config(self, arg: str) -> bool:
+        """Deprecated: point users at /manager and /worker."""
+        self.ui.print_warning("⚠️  /config command deprecated")
+        self.ui.print_info("")
+        self.ui.print_info("Use /manager or /worker commands instead:")
+        self.ui.print_info("  /manager model <name> [--global]")
+        self.ui.print_info("  /manager api <base> [key] [--global]")
+        self.ui.print_info("  /worker model <name> <model>")
+        self.ui.print_info("  /worker api <name> <base> [key]")
+        return True
 
-        # --- Team management ---
-        elif cmd == "/team":
-            self._handle_team_command(arg.strip())
-            return True
+    def _cmd_worker(self, arg: str) -> bool:
+        """Manage workers."""
+        self._handle_worker_command(arg)
+        return True
 
-        # --- Manager management ---
-        elif cmd == "/manager":
-            return self._handle_manager_command(arg.strip())
-
-        # --- Confirm mode ---
-        elif cmd == "/confirm":
-            sub = arg.strip().lower()
-            if sub == "on":
-                self._confirm_mode = True
-                self.ui.print_success("Confirm mode ON. You will be asked before Worker executes tasks.")
-            elif sub == "off":
-                self._confirm_mode = False
-                self.ui.print_success("Confirm mode OFF. Worker tasks will run automatically.")
-            else:
-                status = "ON" if self._confirm_mode else "OFF"
-                self.ui.print_info(f"Confirm mode is {status}. Usage: /confirm <on|off>")
-            return True
+    def _cmd_submanager(self, arg: str) -> bool:
+        """Manage sub-managers."""
+        self._handle_submanager_command(arg)
+        return True
 
-        # --- Undo/Checkpoint ---
-        elif cmd == "/undo":
-            success, msg = self.checkpoint_manager.restore()
-            if success:
-                remaining = len(self.checkpoint_manager.stack)
-                self.ui.print_success(f"Reverted to last checkpoint. Worker changes undone. ({remaining} checkpoints remaining)")
-            else:
-                self.ui.print_warning(msg)
-            return True
+    def _cmd_team(self, arg: str) -> bool:
+        """Manage teams."""
+        self._handle_team_command(arg)
+        return True
 
-        elif cmd == "/checkpoints":
-            checkpoints = self.checkpoint_manager.list_checkpoints()
-            if checkpoints:
-                from rich.table import Table
-                table = Table(title="Git Checkpoints", show_header=True, header_style="bold cyan")
-                table.add_column("#", style="bold", width=3)
-                table.add_column("Tag", style="green")
-                table.add_column("Date", style="dim")
-                for i, tag in enumerate(checkpoints, 1):
-                    # Extract date from tag name: gorchestrator-checkpoint-YYYYMMDD_HHMMSS
-                    date_part = tag.replace("gorchestrator-checkpoint-", "")
-                    try:
-                        dt = datetime.strptime(date_part, "%Y%m%d_%H%M%S")
-                        date_str = dt.strftime("%Y-%m-%d %H:%M:%S")
-                    except Exception:
-                        date_str = date_part
-                    table.add_row(str(i), tag, date_str)
-                self.ui.console.print(table)
-            else:
-                self.ui.print_info("No checkpoints found. Checkpoints are created before Worker executions.")
-            return True
+    def _cmd_manager(self, arg: str) -> bool:
+        """Manage the Manager agent."""
+        return self._handle_manager_command(arg)
+
+    def _cmd_confirm(self, arg: str) -> bool:
+        """Toggle confirmation before Worker executions."""
+        sub = arg.lower()
+        if sub == "on":
+            self._confirm_mode = True
+            self.ui.print_success("Confirm mode ON. You will be asked before Worker executes tasks.")
+        elif sub == "off":
+            self._confirm_mode = False
+            self.ui.print_success("Confirm mode OFF. Worker tasks will run automatically.")
+        else:
+            status = "ON" if self._confirm_mode else "OFF"
+            self.ui.print_info(f"Confirm mode is {status}. Usage: /confirm <on|off>")
+        return True
 
-        return False
+    def _cmd_undo(self, arg: str) -> bool:
+        """Revert to the last git checkpoint."""
+        success, msg = self.checkpoint_manager.restore()
+        if success:
+            remaining = len(self.checkpoint_manager.stack)
+            self.ui.print_success(f"Reverted to last checkpoint. Worker changes undone. ({remaining} checkpoints remaining)")
+        else:
+            self.ui.print_warning(msg)
+        return True
+
+    def _cmd_checkpoints(self, arg: str) -> bool:
+        """List git checkpoints."""
+        checkpoints = self.checkpoint_manager.list_checkpoints()
+        if checkpoints:
+            from rich.table import Table
+            table = Table(title="Git Checkpoints", show_header=True, header_style="bold cyan")
+            table.add_column("#", style="bold", width=3)
+            table.add_column("Tag", style="green")
+            table.add_column("Date", style="dim")
+            for i, tag in enumerate(checkpoints, 1):
+                # Extract date from tag name: gorchestrator-checkpoint-YYYYMMDD_HHMMSS
+                date_part = tag.replace("gorchestrator-checkpoint-", "")
+                try:
+                    dt = datetime.strptime(date_part, "%Y%m%d_%H%M%S")
+                    date_str = dt.strftime("%Y-%m-%d %H:%M:%S")
+                except Exception:
+                    date_str = date_part
+                table.add_row(str(i), tag, date_str)
+            self.ui.console.print(table)
+        else:
+            self.ui.print_info("No checkpoints found. Checkpoints are created before Worker executions.")
+        return True
 
     def _process_user_message(self, user_input: str):
         """Process a user message through the Manager Agent."""
@@ -745,35 +1124,25 @@ class SessionEngine:
             self._auto_save()
 
         except ConnectionError:
-            self.ui.print_error(
-                "Could not connect to LLM API. "
-                "Make sure the proxy is running at: "
-                f"{self.settings.ORCHESTRATOR_API_BASE}"
-            )
+            self.ui.print_error(self._format_error("connect_error"))
         except TimeoutError:
             self.ui.print_error("LLM API request timed out. Please try again.")
         except Exception as e:
-            error_str = str(e).lower()
-            if "connection" in error_str or "refused" in error_str:
-                self.ui.print_error(
-                    f"Cannot connect to {self.settings.ORCHESTRATOR_API_BASE}. "
-                    "Is the proxy running? Use /config show to check."
-                )
-            elif "auth" in error_str or "401" in error_str or "api_key" in error_str:
-                self.ui.print_error(
-                    f"API key rejected by {self.settings.ORCHESTRATOR_API_BASE}. "
-                    "Check ORCHESTRATOR_API_KEY in .env"
-                )
-            elif "model" in error_str or "404" in error_str:
-                self.ui.print_error(
-                    f"Model '{self.settings.ORCHESTRATOR_MODEL}' not found at "
-                    f"{self.settings.ORCHESTRATOR_API_BASE}. "
-                    "Use /model to change or /config show to check."
-                )
+            message = str(e)
+            kind = next((k for k, pattern in _ERROR_KINDS if pattern.search(message)), None)
+            if kind:
+                self.ui.print_error(self._format_error(kind))
             else:
                 logger.error(f"Manager error: {e}")
                 self.ui.print_error(f"Unexpected error: {e}")
 
+    def _format_error(self, kind: str) -> str:
+        """Render the user-facing message for an LLM error kind."""
+        return _ERROR_TEMPLATES[kind].format(
+            api_base=self.settings.ORCHESTRATOR_API_BASE,
+            model=self.settings.ORCHESTRATOR_MODEL,
+        )
+
     def _process_with_confirmation(self, user_input: str) -> ManagerResponse:
         """Process with user confirmation before Worker tasks execute."""
         original_confirm = getattr(self.manager, '_confirm_before_worker', None)
@@ -903,8 +1272,8 @@ class SessionEngine:
                 self.ui.print_info("\nGoodbye!")
                 break
 
-        # Final save before exit
-        self._auto_save()
+        # Final save before exit (fold the journal into a full snapshot)
+        self._auto_save(compact=True)
         self._running = False
 
     def _show_worker_list(self):
@@ -1117,87 +1486,12 @@ class SessionEngine:
             self.manager.refresh_system_prompt()
 
     def _show_help(self):
-        """Display help information."""
-        help_text = """
-## GOrchestrator - Intelligent AI Agent Manager
-
-### How It Works
-You chat with the **Manager Agent**, a Senior Software Architect AI.
-The Manager understands your requests and decides when to delegate tasks
-to the **Worker Agent**, which executes code and terminal commands.
-
-### Session Commands
-| Command | Alias | Description |
-|---------|-------|-------------|
-| `/save [name]` | `/s` | Save current session |
-| `/load [id or name]` | | Load session by ID or name (shows list if no arg) |
-| `/list` | `/l` | List all saved sessions |
-| `/new [name]` | | Start a new session (random name if omitted) |
-| `/clear` | | Clear conversation and start new session |
-| `/clearterminal` | `/ct` | Clear terminal screen only |
-| `/history` | | Show full conversation history |
-
-### Display Commands
-| Command | Description |
-|---------|-------------|
-| `/verbose` | Show detailed Worker output |
-| `/quiet` | Show summarized Worker output |
-
-### Config Commands
-| Command | Description |
-|---------|-------------|
-| `/model [manager\\|worker] <name>` | Change model (saved to .env) |
-| `/config show` | Show current configuration |
-| `/config reload` | Reload .env file |
-| `/config validate` | Check config for issues |
-| `/config set <KEY> <VALUE>` | Set a config value (saved to .env) |
-
-### Worker Management
-| Command | Alias | Description |
-|---------|-------|-------------|
-| `/worker list` | `/w list` | List all worker profiles |
-| `/worker add <name> [model] [profile]` | | Add a new worker |
-| `/worker remove <name>` | | Remove a worker |
-| `/worker set <name> active` | | Activate a worker (multiple can be active) |
-| `/worker set <name> inactive` | | Deactivate a worker |
-| `/worker set <name> primary` | | Set as primary worker (.env sync) |
-| `/worker show <name>` | | Show worker details (model, profile, API, tool) |
-| `/worker model <name> <model>` | | Change a worker's model |
-| `/worker profile <name> <profile>` | | Change a worker's profile |
-| `/worker api <name> <url> [key]` | | Set per-worker API endpoint |
-
-### Config Aliases
-- `/config set manager <model>` → sets ORCHESTRATOR_MODEL
-- `/config set worker <model>` → sets WORKER_MODEL
-
-### Multi-Worker
-- Multiple workers can be **active** simultaneously
-- The **primary** worker's settings are written to `.env`
-- Manager can delegate to multiple workers in parallel
-- Manager chooses which worker(s) to use based on the task
-- Each worker can have its own API endpoint (`/worker api`)
-
-### Safety Commands
-| Command | Description |
-|---------|-------------|
-| `/confirm on\\|off` | Ask before Worker executes |
-| `/undo` | Revert last Worker changes (git) |
-| `/checkpoints` | List available git checkpoints |
-
-### Other
-| Command | Alias | Description |
-|---------|-------|-------------|
-| `/help` | `/h` | Show this help |
-| `exit` | `q` | Exit the application |
-
-### Input Tips
-- **Tab**: Autocomplete slash commands and sub-commands
-- **Arrow Up/Down**: Browse input history
-- **Ctrl+J**: Insert new line
-- **Multi-line paste**: Paste multi-line text directly
-        """
-        from rich.markdown import Markdown
-        self.ui.console.print(Markdown(help_text))
+        """Display help information (Markdown is parsed once and reused)."""
+        global _help_markdown
+        if _help_markdown is None:
+            from rich.markdown import Markdown
+            _help_markdown = Markdown(_HELP_TEXT)
+        self.ui.console.print(_help_markdown)
 
     # ================================================================
     # Manager Command Handlers
@@ -1455,7 +1749,7 @@ to the **Worker Agent**, which executes code and terminal commands.
             return False
         
         try:
-            self.manager.messages[0].content = prompt_text
+            self.manager.set_system_prompt(prompt_text)
             self.ui.print_success("System prompt updated for this session (not saved)")
             return True
         except Exception as e:
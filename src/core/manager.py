@@ -13,13 +13,18 @@ Mixture of Agents: Sub-Managers provide expert advisory analysis via consult_* t
 The Main Manager synthesizes sub-manager analyses and delegates to Workers for execution.
 """
 
+import hashlib
 import json
 import logging
+import operator
 import re
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from itertools import islice
 from pathlib import Path
 from typing import Any, Callable
 
@@ -47,18 +52,41 @@ class MessageRole(Enum):
     TOOL = "tool"
 
 
-@dataclass
+# Whole-message greetings/thanks that never need the tools payload. Short
+# replies like "yes"/"ok" are excluded: they often confirm a pending delegation.
+_SMALL_TALK_RE = re.compile(
+    r"(?:hi|hello|hey|thanks|thank you|thx|bye|goodbye)[\s!.,]*",
+    re.IGNORECASE,
+)
+_SMALL_TALK_MAX_CHARS = 20
+
+
+# Characters of message content shown by ManagerAgent.get_history()
+_PREVIEW_CHARS = 200
+
+
+@dataclass(frozen=True, slots=True)
 class Message:
-    """A message in the conversation."""
+    """A message in the conversation.
+
+    Immutable: replace a message instead of editing it, so the wire dict built
+    once in __post_init__ can be reused by every LLM call.
+    """
     role: MessageRole
     content: str
     tool_calls: list[dict] | None = None
     tool_call_id: str | None = None
     name: str | None = None
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
-
-    def to_dict(self) -> dict:
-        """Convert to OpenAI message format (used by LiteLLM)."""
+    _wire: dict = field(init=False, repr=False, compare=False)
+    # Display projections for get_history(), computed once
+    _preview: str = field(init=False, repr=False, compare=False)
+    _has_tool_calls: bool = field(init=False, repr=False, compare=False)
+    # History dicts, built on first display and reused by later ones
+    _history_dict: dict | None = field(default=None, init=False, repr=False, compare=False)
+    _full_history_dict: dict | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
         msg = {
             "role": self.role.value,
             "content": self.content,
@@ -69,7 +97,36 @@ class Message:
             msg["tool_call_id"] = self.tool_call_id
         if self.name:
             msg["name"] = self.name
-        return msg
+        object.__setattr__(self, "_wire", msg)
+
+        content = self.content or ""
+        preview = content[:_PREVIEW_CHARS] + "..." if len(content) > _PREVIEW_CHARS else content
+        object.__setattr__(self, "_preview", preview)
+        object.__setattr__(self, "_has_tool_calls", bool(self.tool_calls))
+
+    def to_dict(self) -> dict:
+        """Convert to OpenAI message format (used by LiteLLM).
+
+        Returns the cached dict; callers must not mutate it.
+        """
+        return self._wire
+
+    def history_dict(self, full: bool = False) -> dict:
+        """Display dict for get_history() (preview content) or get_full_history().
+
+        Built once per message and cached; callers must not mutate it.
+        """
+        attr = "_full_history_dict" if full else "_history_dict"
+        entry = getattr(self, attr)
+        if entry is None:
+            entry = {
+                "role": self.role.value,
+                "content": self.content if full else self._preview,
+                "timestamp": self.timestamp,
+                "has_tool_calls": self._has_tool_calls,
+            }
+            object.__setattr__(self, attr, entry)
+        return entry
 
 
 # Base system prompt (worker list appended dynamically)
@@ -259,6 +316,61 @@ class ManagerResponse:
         return bool(self.tool_calls)
 
 
+class ToolCallCache:
+    """Bounded LRU cache of successful Worker delegations, with a TTL.
+
+    Keyed by a digest of the task, context and the worker target, so an
+    identical delegation within ``ttl_seconds`` reuses the stored TaskResult
+    instead of running the Worker again. Thread-safe: tool calls run in parallel.
+    """
+
+    def __init__(self, max_entries: int = 64, ttl_seconds: float = 0.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, TaskResult]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(task_description: str, context: str, *target: str | None) -> str:
+        """Build a stable key from the task and its target (model, profile, ...)."""
+        payload = json.dumps(
+            {"t": task_description, "c": context, "w": target},
+            sort_keys=True, ensure_ascii=False,
+        )
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> TaskResult | None:
+        """Return the cached result for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, result = entry
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return result
+
+    def put(self, key: str, result: TaskResult):
+        """Store a successful result; failures and cancellations are never cached."""
+        if not result.is_success or self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all cached results."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 class ManagerAgent:
     """
     The Manager Agent - an LLM-powered orchestrator that communicates
@@ -296,6 +408,10 @@ class ManagerAgent:
         self.worker_registry = worker_registry
         self.sub_manager_registry = sub_manager_registry
         self.messages: list[Message] = []
+        # Wire dicts for self.messages, kept in lockstep by _append_message();
+        # _wire_src holds the Message each entry of _wire was built from
+        self._wire: list[dict] = []
+        self._wire_src: list[Message] = []
         self.on_worker_output = on_worker_output
         self.on_thinking = on_thinking
         self.on_before_worker = on_before_worker
@@ -304,6 +420,9 @@ class ManagerAgent:
         self._confirm_before_worker: Callable[[str], bool] | None = None
         self._executor = get_executor()
 
+        # Reuse of identical successful delegations (disabled when WORKER_CACHE_TTL is 0)
+        self._tool_cache = ToolCallCache(ttl_seconds=self.settings.WORKER_CACHE_TTL)
+
         # Sub-manager agent (for LLM calls to advisors)
         self._sub_manager_agent = SubManagerAgent() if sub_manager_registry else None
 
@@ -311,9 +430,18 @@ class ManagerAgent:
         gorchestrator_dir = Path(__file__).resolve().parent.parent.parent / ".gorchestrator"
         self._llm_pool = LLMPool(registry_file=gorchestrator_dir / "manager_llms.json")
 
+        # (system Message, prompt-caching wire dict) for Anthropic requests
+        self._system_wire_cache: tuple[Message, dict] | None = None
+        # (active sub-manager/worker signature, tools list) for _build_all_tools()
+        self._tools_cache: tuple[tuple, list[dict]] | None = None
+
         # Initialize with system prompt
         self._add_system_message()
 
+    def clear_cache(self):
+        """Forget cached Worker results (e.g. after files changed outside the Worker)."""
+        self._tool_cache.clear()
+
     def shutdown(self):
         """Clean up references (shared executor is managed by config module)."""
         self._executor = None
@@ -332,6 +460,42 @@ class ManagerAgent:
             return
         # Keep the first message (system) + last (max_msgs - 1) messages
         self.messages = [self.messages[0]] + self.messages[-(max_msgs - 1):]
+        if self._wire:
+            self._wire_src = [self._wire_src[0]] + self._wire_src[-(max_msgs - 1):]
+            self._wire = [self._wire[0]] + self._wire[-(max_msgs - 1):]
+
+    def _reset_messages(self):
+        """Empty the history and its wire dict list together."""
+        self.messages = []
+        self._wire = []
+        self._wire_src = []
+
+    def _wire_in_sync(self) -> bool:
+        """True if self._wire was built from exactly the Messages in self.messages.
+
+        Compares every entry by identity, so a message replaced in the middle
+        of the history is caught, not just edits at either end.
+        """
+        msgs = self.messages
+        return len(self._wire_src) == len(msgs) and all(map(operator.is_, self._wire_src, msgs))
+
+    def _append_message(self, msg: Message):
+        """Append to the history, extending the wire dict list in step."""
+        self.messages.append(msg)
+        self._wire_src.append(msg)
+        self._wire.append(msg.to_dict())
+
+    def _wire_messages(self) -> list[dict]:
+        """Return the wire dicts for self.messages, rebuilding only if the
+        history was changed without _append_message().
+
+        The dicts are shared with each Message; copy them before handing them
+        to code that may edit them.
+        """
+        if not self._wire_in_sync():
+            self._wire_src = list(self.messages)
+            self._wire = [msg.to_dict() for msg in self.messages]
+        return self._wire
 
     # ================================================================
     # System Prompt & Tool Building
@@ -403,11 +567,26 @@ class ManagerAgent:
         return []
 
     def _build_all_tools(self) -> list[dict]:
-        """Build all tool definitions: consult_* (sub-managers) + delegate_to_* (workers)."""
+        """Build all tool definitions: consult_* (sub-managers) + delegate_to_* (workers).
+
+        The same list object is returned while the active sub-managers and
+        workers are unchanged, so the tools payload stays identical (and
+        prefix-cacheable) across LLM calls. Treat it as read-only.
+        """
+        active_sms = self._get_active_sub_managers()
+        active_workers = self._get_active_workers()
+        signature = (
+            tuple((sm.name, sm.description) for sm in active_sms),
+            tuple((wc.name, wc.model, wc.profile) for wc in active_workers),
+        )
+        cached = self._tools_cache
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
         tools = []
 
         # Consult tools from active sub-managers
-        for sm in self._get_active_sub_managers():
+        for sm in active_sms:
             safe_name = _sanitize_tool_name(sm.name)
             tool_name = f"consult_{safe_name}"
             description = (
@@ -419,7 +598,6 @@ class ManagerAgent:
             tools.append(_make_consult_tool(tool_name, sm.name, description))
 
         # Delegate tools from active workers
-        active_workers = self._get_active_workers()
         if active_workers:
             for wc in active_workers:
                 safe_name = _sanitize_tool_name(wc.name)
@@ -435,6 +613,7 @@ class ManagerAgent:
             # Legacy single-worker tool
             tools.append(WORKER_TOOL)
 
+        self._tools_cache = (signature, tools)
         return tools
 
     def _build_worker_tools(self) -> list[dict]:
@@ -443,15 +622,42 @@ class ManagerAgent:
 
     def refresh_system_prompt(self):
         """Rebuild the system prompt (call after worker registry changes)."""
-        new_prompt = self._build_system_prompt()
+        self.set_system_prompt(self._build_system_prompt())
+
+    def set_system_prompt(self, prompt: str):
+        """Replace the system message (or insert one if missing)."""
+        system_msg = Message(role=MessageRole.SYSTEM, content=prompt)
         if self.messages and self.messages[0].role == MessageRole.SYSTEM:
-            self.messages[0].content = new_prompt
+            self.messages[0] = system_msg
+            if self._wire:
+                self._wire_src[0] = system_msg
+                self._wire[0] = system_msg.to_dict()
         else:
-            self.messages.insert(0, Message(role=MessageRole.SYSTEM, content=new_prompt))
+            self.messages.insert(0, system_msg)
+            self._wire_src.insert(0, system_msg)
+            self._wire.insert(0, system_msg.to_dict())
+
+    def _cacheable_system_dict(self, system_msg: Message) -> dict:
+        """Return the system message as a cache_control-marked content block.
+
+        Built once per system Message, so every turn sends an identical prefix.
+        """
+        cached = self._system_wire_cache
+        if cached is None or cached[0] is not system_msg:
+            wire = {
+                "role": "system",
+                "content": [{
+                    "type": "text",
+                    "text": system_msg.content,
+                    "cache_control": {"type": "ephemeral"},
+                }],
+            }
+            cached = self._system_wire_cache = (system_msg, wire)
+        return cached[1]
 
     def _add_system_message(self):
         """Add the system prompt to messages."""
-        self.messages.append(Message(
+        self._append_message(Message(
             role=MessageRole.SYSTEM,
             content=self._build_system_prompt(),
         ))
@@ -528,10 +734,17 @@ class ManagerAgent:
         model_name = strip_provider_prefix(config["model"])
         provider = detect_provider(config["model"])
 
+        # Copy the list and each dict: LiteLLM edits message dicts on some
+        # provider paths, and the originals are cached on each Message
+        messages = [dict(wire) for wire in self._wire_messages()]
+        if provider == "anthropic" and messages and messages[0]["role"] == "system":
+            # Mark the stable tools + system prefix for Anthropic prompt caching
+            messages[0] = dict(self._cacheable_system_dict(self.messages[0]))
+
         # Build kwargs with profile-specified or default values
         kwargs: dict[str, Any] = {
             "model": model_name,
-            "messages": [msg.to_dict() for msg in self.messages],
+            "messages": messages,
             "api_base": config["api_base"],
             "api_key": config["api_key"],
             "custom_llm_provider": provider,
@@ -690,47 +903,53 @@ class ManagerAgent:
             )
             return None, msg
 
+    def _run_calls_concurrently(
+        self,
+        calls: list[dict],
+        execute: Callable[[dict], tuple[Any, Message]],
+        error_label: str,
+    ) -> list[tuple[Any, Message]]:
+        """Run independent tool calls concurrently; return outcomes in call order.
+
+        Latency is that of the slowest call rather than the sum. Results keep
+        the LLM's original tool_call order so the history is deterministic.
+        A single call runs inline (no thread overhead).
+        """
+        if len(calls) == 1:
+            return [execute(calls[0])]
+
+        futures = [self._executor.submit(execute, tc) for tc in calls]
+        outcomes: list[tuple[Any, Message]] = []
+        for tc, future in zip(calls, futures):
+            try:
+                outcomes.append(future.result())
+            except Exception as e:
+                fn_name = tc.get("function", {}).get("name", "unknown")
+                logger.error(f"Parallel {fn_name} execution failed: {e}")
+                outcomes.append((None, Message(
+                    role=MessageRole.TOOL,
+                    content=f"Error: {error_label}: {e}",
+                    tool_call_id=tc.get("id", "unknown"),
+                    name=fn_name,
+                )))
+        return outcomes
+
     def _handle_consult_calls(self, consult_calls: list[dict]) -> list[SubManagerResponse]:
         """
         Handle consult_* tool calls from the LLM response.
         Runs multiple consult calls in parallel via ThreadPoolExecutor.
         """
-        responses: list[SubManagerResponse] = []
-        messages: list[Message] = []
+        if len(consult_calls) > 1:
+            self._notify_thinking(f"Consulting {len(consult_calls)} advisors in parallel...")
+        outcomes = self._run_calls_concurrently(
+            consult_calls, self._execute_single_consult, "Consultation failed",
+        )
 
-        if len(consult_calls) == 1:
-            sm_resp, msg = self._execute_single_consult(consult_calls[0])
+        responses: list[SubManagerResponse] = []
+        for sm_resp, msg in outcomes:
             if sm_resp:
                 responses.append(sm_resp)
-            messages.append(msg)
-        else:
-            self._notify_thinking(f"Consulting {len(consult_calls)} advisors in parallel...")
-            future_to_tc = {
-                self._executor.submit(self._execute_single_consult, tc): tc
-                for tc in consult_calls
-            }
-            for future in as_completed(future_to_tc):
-                try:
-                    sm_resp, msg = future.result()
-                    if sm_resp:
-                        responses.append(sm_resp)
-                    messages.append(msg)
-                except Exception as e:
-                    tc = future_to_tc[future]
-                    call_id = tc.get("id", "unknown")
-                    fn_name = tc.get("function", {}).get("name", "unknown")
-                    logger.error(f"Parallel consult execution failed: {e}")
-                    messages.append(Message(
-                        role=MessageRole.TOOL,
-                        content=f"Error: Consultation failed: {e}",
-                        tool_call_id=call_id,
-                        name=fn_name,
-                    ))
-
-        # Append tool messages in order (deterministic for history)
-        messages.sort(key=lambda m: m.tool_call_id or "")
-        for msg in messages:
-            self.messages.append(msg)
+            self._append_message(msg)
 
         return responses
 
@@ -776,6 +995,20 @@ class ManagerAgent:
         if context:
             full_task = f"Context: {context}\n\nTask: {task_description}"
 
+        # Determine model, profile, and API overrides
+        if worker_config:
+            model = worker_config.model
+            profile = worker_config.profile
+            api_base = worker_config.api_base
+            api_key = worker_config.api_key
+            worker_name = worker_config.name
+        else:
+            model = self.settings.WORKER_MODEL
+            profile = self.settings.WORKER_PROFILE
+            api_base = None
+            api_key = None
+            worker_name = "worker"
+
         # Ask for confirmation if confirm mode is on
         if self._confirm_before_worker:
             if not self._confirm_before_worker(task_description):
@@ -786,24 +1019,25 @@ class ManagerAgent:
                     duration_seconds=0.0,
                 )
 
+        # An identical successful delegation within the TTL is answered from cache
+        cache_key = None
+        if self._tool_cache.ttl_seconds > 0:
+            cache_key = ToolCallCache.make_key(
+                task_description, context, model, profile, api_base,
+                str(self.settings.AGENT_PATH),
+            )
+            cached = self._tool_cache.get(cache_key)
+            if cached is not None:
+                self._notify_thinking(f"Reusing cached result from Worker '{worker_name}'...")
+                return cached
+
         # Notify before worker execution (e.g. create checkpoint)
         if self.on_before_worker:
             self.on_before_worker(task_description)
 
-        # Determine model, profile, and API overrides
         if worker_config:
-            model = worker_config.model
-            profile = worker_config.profile
-            api_base = worker_config.api_base
-            api_key = worker_config.api_key
-            worker_name = worker_config.name
             self._notify_thinking(f"Delegating to Worker '{worker_name}'...")
         else:
-            model = self.settings.WORKER_MODEL
-            profile = self.settings.WORKER_PROFILE
-            api_base = None
-            api_key = None
-            worker_name = "worker"
             self._notify_thinking("Delegating to Worker Agent...")
 
         # Wrap on_worker_output to include worker name
@@ -820,6 +1054,8 @@ class ManagerAgent:
             on_output=_tagged_output,
         )
 
+        if cache_key is not None:
+            self._tool_cache.put(cache_key, result)
         return result
 
     def _execute_single_tool_call(self, tool_call: dict) -> tuple[TaskResult | None, Message]:
@@ -884,44 +1120,17 @@ class ManagerAgent:
         Handle tool calls from the LLM response.
         Runs multiple worker calls in parallel via ThreadPoolExecutor.
         """
-        results: list[TaskResult] = []
-        messages: list[Message] = []
+        if len(tool_calls) > 1:
+            self._notify_thinking(f"Running {len(tool_calls)} workers in parallel...")
+        outcomes = self._run_calls_concurrently(
+            tool_calls, self._execute_single_tool_call, "Worker execution failed",
+        )
 
-        if len(tool_calls) == 1:
-            # Single call -- no thread overhead
-            result, msg = self._execute_single_tool_call(tool_calls[0])
+        results: list[TaskResult] = []
+        for result, msg in outcomes:
             if result:
                 results.append(result)
-            messages.append(msg)
-        else:
-            # Parallel execution
-            self._notify_thinking(f"Running {len(tool_calls)} workers in parallel...")
-            future_to_tc = {
-                self._executor.submit(self._execute_single_tool_call, tc): tc
-                for tc in tool_calls
-            }
-            for future in as_completed(future_to_tc):
-                try:
-                    result, msg = future.result()
-                    if result:
-                        results.append(result)
-                    messages.append(msg)
-                except Exception as e:
-                    tc = future_to_tc[future]
-                    call_id = tc.get("id", "unknown")
-                    fn_name = tc.get("function", {}).get("name", "unknown")
-                    logger.error(f"Parallel worker execution failed: {e}")
-                    messages.append(Message(
-                        role=MessageRole.TOOL,
-                        content=f"Error: Worker execution failed: {e}",
-                        tool_call_id=call_id,
-                        name=fn_name,
-                    ))
-
-        # Append tool messages in order (deterministic for history)
-        messages.sort(key=lambda m: m.tool_call_id or "")
-        for msg in messages:
-            self.messages.append(msg)
+            self._append_message(msg)
 
         return results
 
@@ -933,8 +1142,8 @@ class ManagerAgent:
         status = "SUCCESS" if result.is_success else "FAILED"
 
         # Get last N lines of output
-        output_lines = result.output_lines[-50:] if result.output_lines else []
-        output_text = "\n".join(output_lines)
+        lines = result.output_lines
+        output_text = "\n".join(islice(lines, max(0, len(lines) - 50), None))
 
         return f"""Worker Agent Result{label}:
 Status: {status}
@@ -953,6 +1162,20 @@ Output (last 50 lines):
     # Chat Loop
     # ================================================================
 
+    def _should_include_tools(self, user_message: str) -> bool:
+        """Return False for small talk, so the first LLM call skips the tools payload.
+
+        Tools are still sent once the history has tool calls: the request must
+        then define them (Anthropic rejects tool blocks without tools).
+        """
+        text = user_message.strip()
+        if len(text) > _SMALL_TALK_MAX_CHARS or not _SMALL_TALK_RE.fullmatch(text):
+            return True
+        if any(msg._has_tool_calls for msg in self.messages):
+            return True
+        logger.debug(f"Small talk, calling LLM without tools: {text!r}")
+        return False
+
     def chat(self, user_message: str) -> ManagerResponse:
         """
         Process a user message and generate a response.
@@ -960,7 +1183,7 @@ Output (last 50 lines):
         Supports parallel worker execution when multiple tool calls are made.
         Supports sub-manager consultation via consult_* tools.
         """
-        self.messages.append(Message(
+        self._append_message(Message(
             role=MessageRole.USER,
             content=user_message,
         ))
@@ -971,7 +1194,7 @@ Output (last 50 lines):
             valid = [r for r in parallel_responses if not r.error]
             if valid:
                 synthesis_msg = self._build_synthesis_user_message(parallel_responses)
-                self.messages.append(Message(
+                self._append_message(Message(
                     role=MessageRole.USER,
                     content=synthesis_msg,
                 ))
@@ -982,8 +1205,10 @@ Output (last 50 lines):
         sub_manager_responses = []
         max_iterations = 7  # Increased: consult + synthesis + worker rounds
 
+        include_tools = self._should_include_tools(user_message)
         for iteration in range(max_iterations):
-            response = self._call_llm()
+            response = self._call_llm(include_tools=include_tools)
+            include_tools = True
             choice = response.choices[0]
             message = choice.message
 
@@ -996,12 +1221,14 @@ Output (last 50 lines):
                 logger.warning(f"LLM requested {len(tool_calls)} tool calls, capping at {MAX_CONCURRENT}")
                 tool_calls = tool_calls[:MAX_CONCURRENT]
 
+            # Dump once: the same dicts go into history and to the handlers
+            tc_dicts = [tc.model_dump() for tc in tool_calls] if tool_calls else None
             assistant_msg = Message(
                 role=MessageRole.ASSISTANT,
                 content=content,
-                tool_calls=[tc.model_dump() for tc in tool_calls] if tool_calls else None,
+                tool_calls=tc_dicts,
             )
-            self.messages.append(assistant_msg)
+            self._append_message(assistant_msg)
 
             if not tool_calls:
                 return ManagerResponse(
@@ -1011,7 +1238,6 @@ Output (last 50 lines):
                 )
 
             # Separate tool calls by type: consult_* vs delegate_to_*
-            tc_dicts = [tc.model_dump() for tc in tool_calls]
             consult_calls = [
                 tc for tc in tc_dicts
                 if tc.get("function", {}).get("name", "").startswith("consult_")
@@ -1052,41 +1278,38 @@ Output (last 50 lines):
     # ================================================================
 
     def get_history(self) -> list[dict]:
-        """Get conversation history as list of dicts (truncated for display)."""
+        """Get conversation history as list of dicts (truncated for display).
+
+        The dicts are cached on their messages; callers must not mutate them.
+        """
         return [
-            {
-                "role": msg.role.value,
-                "content": msg.content[:200] + "..." if len(msg.content) > 200 else msg.content,
-                "timestamp": msg.timestamp,
-                "has_tool_calls": bool(msg.tool_calls),
-            }
+            msg.history_dict()
             for msg in self.messages
             if msg.role != MessageRole.SYSTEM
         ]
 
     def get_full_history(self) -> list[dict]:
-        """Get full conversation history without truncation."""
+        """Get full conversation history without truncation (cached dicts, as get_history())."""
         return [
-            {
-                "role": msg.role.value,
-                "content": msg.content,
-                "timestamp": msg.timestamp,
-                "has_tool_calls": bool(msg.tool_calls),
-            }
+            msg.history_dict(full=True)
             for msg in self.messages
             if msg.role != MessageRole.SYSTEM
         ]
 
     def clear_history(self):
-        """Clear conversation history (keep system prompt)."""
-        self.messages = []
+        """Clear conversation history (keep system prompt) and cached Worker results."""
+        self._reset_messages()
         self._add_system_message()
+        self.clear_cache()
 
-    def export_history(self) -> list[dict]:
+    def export_history(self, start: int = 0) -> list[dict]:
         """Export full conversation history for persistence.
 
         API keys in message content are masked to prevent credential leakage
         into session files.
+
+        Args:
+            start: Index of the first message to export (for incremental saves).
         """
         return [
             {
@@ -1097,17 +1320,21 @@ Output (last 50 lines):
                 "tool_call_id": msg.tool_call_id,
                 "name": msg.name,
             }
-            for msg in self.messages
+            for msg in self.messages[start:]
         ]
 
     def import_history(self, history: list[dict]):
         """Import conversation history from persistence."""
-        self.messages = []
+        self._reset_messages()
+        # Worker results cached for the previous conversation do not carry over
+        self.clear_cache()
+        # Always start with the current system prompt (with active workers)
+        self._add_system_message()
         for entry in history:
             role = MessageRole(entry.get("role", "user"))
             if role == MessageRole.SYSTEM:
                 continue
-            self.messages.append(Message(
+            self._append_message(Message(
                 role=role,
                 content=entry.get("content", ""),
                 timestamp=entry.get("timestamp", datetime.now().isoformat()),
@@ -1115,9 +1342,3 @@ Output (last 50 lines):
                 tool_call_id=entry.get("tool_call_id"),
                 name=entry.get("name"),
             ))
-
-        # Always prepend the current system prompt (with active workers)
-        self.messages.insert(0, Message(
-            role=MessageRole.SYSTEM,
-            content=self._build_system_prompt(),
-        ))
@@ -5,12 +5,18 @@ Handles spawning the agent process with proper environment injection and real-ti
 
 import logging
 import os
+import queue
 import re
+import selectors
 import subprocess
+import sys
+import threading
 import time
-from collections.abc import Callable, Generator
+from collections import deque
+from collections.abc import Callable, Generator, Iterator
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cache
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -29,6 +35,98 @@ _NOISE_PATTERNS = [
 ]
 _NOISE_RE = re.compile("|".join(re.escape(p) for p in _NOISE_PATTERNS))
 
+# Bytes requested per os.read() on the Worker's stdout pipe
+_PIPE_READ_SIZE = 64 * 1024
+
+
+def _read_chunks(fd: int, deadline: float | None) -> Iterator[bytes]:
+    """Yield raw chunks from a pipe fd until EOF.
+
+    With a deadline (time.monotonic() value), waits at most until then for the
+    next chunk and raises TimeoutError otherwise, so a silent Worker cannot
+    block past its budget. POSIX pipes are polled with selectors; on Windows,
+    where select() only works on sockets, a reader thread feeds a queue.
+    """
+    if deadline is None:
+        while chunk := os.read(fd, _PIPE_READ_SIZE):
+            yield chunk
+        return
+
+    if sys.platform == "win32":
+        chunks: queue.Queue[bytes] = queue.Queue()
+
+        def _pump():
+            try:
+                while chunk := os.read(fd, _PIPE_READ_SIZE):
+                    chunks.put(chunk)
+            except OSError:
+                pass
+            chunks.put(b"")
+
+        threading.Thread(target=_pump, name="worker-pipe-reader", daemon=True).start()
+        while True:
+            try:
+                chunk = chunks.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                raise TimeoutError from None
+            if not chunk:
+                return
+            yield chunk
+
+    with selectors.DefaultSelector() as sel:
+        sel.register(fd, selectors.EVENT_READ)
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not sel.select(timeout=remaining):
+                raise TimeoutError
+            chunk = os.read(fd, _PIPE_READ_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+
+def _iter_pipe_lines(pipe, deadline: float | None = None) -> Iterator[str]:
+    """Yield decoded lines from a binary pipe, reading up to 64 KiB per syscall.
+
+    Lines end at \n, \r\n or \r (like text-mode universal newlines) and are
+    decoded as UTF-8 with replacement, one complete batch at a time.
+    Raises TimeoutError once ``deadline`` (time.monotonic()) passes.
+    """
+    buf = bytearray()
+    for chunk in _read_chunks(pipe.fileno(), deadline):
+        buf += chunk
+        end = buf.rfind(b"\n")
+        if end < 0:
+            continue
+        # splitlines() on the \n-terminated prefix keeps empty lines and \r\n pairs intact
+        complete = bytes(buf[:end + 1])
+        del buf[:end + 1]
+        for raw in complete.splitlines():
+            yield raw.decode("utf-8", "replace")
+    for raw in bytes(buf).splitlines():
+        yield raw.decode("utf-8", "replace")
+
+
+@cache
+def _uv_cache_dir() -> str | None:
+    """Return uv's cache directory as resolved in this process, or None.
+
+    The Worker env is allowlisted, so variables uv uses to locate its cache
+    (XDG_CACHE_HOME, LOCALAPPDATA, ...) may not reach the subprocess. Resolving
+    the directory once here and pinning UV_CACHE_DIR keeps every `uv run` on the
+    same warm cache. The lookup runs `uv cache dir` only on the first call.
+    """
+    try:
+        out = subprocess.run(
+            ["uv", "cache", "dir"], capture_output=True, text=True, timeout=10,
+        )
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.debug(f"Could not resolve uv cache dir: {e}")
+        return None
+    if out.returncode == 0 and out.stdout.strip():
+        return out.stdout.strip()
+    return None
+
 
 class TaskStatus(Enum):
     """Status of a task execution."""
@@ -44,7 +142,8 @@ class TaskResult:
     """Structured result from an agent task execution."""
     status: TaskStatus
     exit_code: int
-    output_lines: list[str] = field(default_factory=list)
+    # run_task() fills a bounded deque holding only the most recent lines
+    output_lines: list[str] | deque[str] = field(default_factory=list)
     total_cost: float = 0.0
     step_count: int = 0
     duration_seconds: float = 0.0
@@ -85,6 +184,8 @@ class AgentWorker:
             settings: Optional Settings instance. If None, uses default settings.
         """
         self.settings = settings or get_settings()
+        # (settings.agent_env it was built from, merged env) for _base_env()
+        self._env_cache: tuple[object, dict[str, str]] | None = None
 
     def _build_command(self, task: str, model: str, profile: str | None = None) -> list[str]:
         """
@@ -120,21 +221,46 @@ class AgentWorker:
         "TERM", "COLORTERM", "FORCE_COLOR",
     }
 
+    def _base_env(self) -> dict[str, str]:
+        """
+        Return the shared per-settings part of the Worker environment.
+
+        Built once and reused until settings.agent_env changes (Settings drops
+        that cached property when PROXY_URL/PROXY_KEY are set, so a new object
+        means a rebuild). The process environment is read at build time only.
+        """
+        agent_env = self.settings.agent_env
+        if self._env_cache is not None and self._env_cache[0] is agent_env:
+            return self._env_cache[1]
+        env = {k: v for k, v in os.environ.items() if k in self._ENV_ALLOWLIST}
+        env.update(agent_env)
+        # Pin uv's cache so the Worker starts from the same warm cache as this process
+        if "UV_CACHE_DIR" not in env:
+            cache_dir = _uv_cache_dir()
+            if cache_dir:
+                env["UV_CACHE_DIR"] = cache_dir
+        # Suppress LiteLLM INFO log spam
+        env["LITELLM_LOG"] = "ERROR"
+        self._env_cache = (agent_env, env)
+        return env
+
     def _build_env(self, api_base_override: str | None = None, api_key_override: str | None = None) -> dict[str, str]:
         """
         Build minimal environment variables for the subprocess.
         Only allowlisted env vars are passed to prevent credential leakage.
         Supports per-worker API overrides.
+
+        Without overrides the cached base env is returned as-is; treat it as read-only.
         """
-        env = {k: v for k, v in os.environ.items() if k in self._ENV_ALLOWLIST}
-        env.update(self.settings.get_agent_env())
+        env = self._base_env()
+        if not api_base_override and not api_key_override:
+            return env
+        env = dict(env)
         # Per-worker API override -- pass base URL as-is, LiteLLM adds suffix
         if api_base_override:
             env["MINI_API_BASE"] = api_base_override.rstrip("/")
         if api_key_override:
             env["MINI_API_KEY"] = api_key_override
-        # Suppress LiteLLM INFO log spam
-        env["LITELLM_LOG"] = "ERROR"
         return env
 
     @staticmethod
@@ -169,6 +295,7 @@ class AgentWorker:
         api_base: str | None = None,
         api_key: str | None = None,
         on_output: Callable[[str], None] | None = None,
+        timeout: float = 0,
     ) -> Generator[str, None, int]:
         """
         Run the agent with the given task and stream output in real-time.
@@ -180,6 +307,8 @@ class AgentWorker:
             api_base: Optional per-worker API base URL override.
             api_key: Optional per-worker API key override.
             on_output: Optional callback for each output line.
+            timeout: Wall-clock seconds allowed for the process (0 = no limit).
+                TimeoutError is raised when it passes, even if no output arrives.
 
         Yields:
             Output lines from the agent process as they arrive.
@@ -205,14 +334,12 @@ class AgentWorker:
                 env=env,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                bufsize=1,
-                encoding="utf-8",
-                errors="replace",
+                bufsize=0,
             )
 
+            deadline = time.monotonic() + timeout if timeout > 0 else None
             if process.stdout:
-                for line in process.stdout:
-                    clean_line = line.rstrip("\n\r")
+                for clean_line in _iter_pipe_lines(process.stdout, deadline):
                     # Skip noisy third-party log lines
                     if self._is_noise_line(clean_line):
                         continue
@@ -220,7 +347,13 @@ class AgentWorker:
                         on_output(clean_line)
                     yield clean_line
 
-            process.wait()
+            if deadline is None:
+                process.wait()
+            else:
+                try:
+                    process.wait(timeout=max(0.0, deadline - time.monotonic()))
+                except subprocess.TimeoutExpired:
+                    raise TimeoutError from None
             return process.returncode
 
         except KeyboardInterrupt:
@@ -261,42 +394,36 @@ class AgentWorker:
         Returns:
             TaskResult with status, output, cost, and other metrics.
         """
-        from ..utils.parser import parse_log_line
+        from ..utils.parser import AgentLogEntry, parse_log_line
 
-        output_lines: list[str] = []
+        # Keep only the tail of the output; 0 = unbounded
+        max_kept = self.settings.WORKER_MAX_KEPT_LINES
+        output_lines: deque[str] = deque(maxlen=max_kept if max_kept > 0 else None)
         step_count = 0
         total_cost = 0.0
         start_time = time.time()
         exit_code = 0
         error_message = None
 
+        timeout = self.settings.WORKER_TIMEOUT
         try:
-            gen = self.run(task, model, profile, api_base, api_key, on_output)
-            timeout = self.settings.WORKER_TIMEOUT
+            gen = self.run(task, model, profile, api_base, api_key, on_output, timeout=timeout)
 
             for line in gen:
                 output_lines.append(line)
 
-                # Check timeout
-                if timeout > 0 and (time.time() - start_time) > timeout:
-                    logger.warning(f"Worker task timed out after {timeout}s")
-                    gen.close()
-                    return TaskResult(
-                        status=TaskStatus.FAILED,
-                        exit_code=-2,
-                        output_lines=output_lines,
-                        step_count=step_count,
-                        total_cost=total_cost,
-                        duration_seconds=time.time() - start_time,
-                        error_message=f"Task timed out after {timeout} seconds",
-                    )
-
-                # Parse line to extract metrics
+                # Parse line to extract metrics. Step/cost logs always carry
+                # the quoted type name, so other lines skip the JSON parse.
+                if '"step"' not in line and '"cost"' not in line:
+                    continue
                 entry = parse_log_line(line)
-                if hasattr(entry, "is_step") and entry.is_step:
-                    step_count += 1
-                if hasattr(entry, "cost") and entry.cost:
-                    total_cost = entry.cost
+                if type(entry) is AgentLogEntry:
+                    if entry.log_type == "step":
+                        step_count += 1
+                    elif entry.log_type == "cost":
+                        cost = entry.cost
+                        if cost:
+                            total_cost = cost
 
             # Get exit code from generator
             try:
@@ -304,6 +431,17 @@ class AgentWorker:
             except StopIteration as e:
                 exit_code = e.value if e.value is not None else 0
 
+        except TimeoutError:
+            logger.warning(f"Worker task timed out after {timeout}s")
+            return TaskResult(
+                status=TaskStatus.FAILED,
+                exit_code=-2,
+                output_lines=output_lines,
+                step_count=step_count,
+                total_cost=total_cost,
+                duration_seconds=time.time() - start_time,
+                error_message=f"Task timed out after {timeout} seconds",
+            )
         except FileNotFoundError as e:
             error_message = str(e)
             return TaskResult(
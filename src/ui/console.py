@@ -4,10 +4,14 @@ Provides beautiful formatting for Manager, Worker, and User interactions.
 Uses prompt_toolkit for advanced input (history, multi-line paste, autocomplete).
 """
 
+import sys
+import threading
+import time
 from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 from prompt_toolkit import PromptSession
 from prompt_toolkit.auto_suggest import AutoSuggestFromHistory
@@ -37,6 +41,7 @@ class SafeFileHistory(FileHistory):
 from rich.console import Console, Group
 from rich.live import Live
 from rich.markdown import Markdown
+from rich.markup import escape
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 from rich.prompt import Prompt
@@ -46,7 +51,126 @@ from rich.table import Table
 from rich.text import Text
 from rich.theme import Theme
 
-from ..utils.parser import AgentLogEntry, LogEntry, RawLogEntry
+from ..utils.parser import LogEntry, RawLogEntry
+
+
+class _TerminalBuffer:
+    """File-like wrapper that coalesces Rich's write()+flush() per print.
+
+    Rich flushes after every print, so a Worker log burst costs one terminal
+    write per line. While batching (a Worker section), flush() is soft: text
+    reaches the terminal at once after an idle period, otherwise when
+    max_chars pile up or, at the latest, max_delay seconds later via a timer.
+    Outside batching every flush() writes through. Each write to the stream is
+    at most max_chars long. Other attributes (isatty, fileno, encoding) are
+    delegated so Rich still detects the terminal.
+    """
+
+    def __init__(self, stream: TextIO, max_chars: int = 8192, max_delay: float = 0.05):
+        self._stream = stream
+        self._max_chars = max_chars
+        self._max_delay = max_delay
+        self._parts: list[str] = []
+        self._size = 0
+        self._last_flush = 0.0
+        self._timer: threading.Timer | None = None
+        self._batching = False
+        self._lock = threading.Lock()
+
+    def start_batching(self):
+        with self._lock:
+            self._batching = True
+
+    def stop_batching(self):
+        """Leave batching mode and write out anything still buffered."""
+        with self._lock:
+            self._batching = False
+            self._drain()
+
+    def write(self, text: str) -> int:
+        with self._lock:
+            self._parts.append(text)
+            self._size += len(text)
+        return len(text)
+
+    def flush(self):
+        with self._lock:
+            if (not self._batching or self._size >= self._max_chars
+                    or time.monotonic() - self._last_flush >= self._max_delay):
+                self._drain()
+            elif self._timer is None and self._parts:
+                self._timer = threading.Timer(self._max_delay, self.flush_now)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush_now(self):
+        with self._lock:
+            self._drain()
+
+    def _drain(self):
+        """Write out buffered text; caller holds the lock."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._parts:
+            text = "".join(self._parts)
+            step = self._max_chars
+            for start in range(0, len(text), step):
+                self._stream.write(text[start:start + step])
+            self._parts.clear()
+            self._size = 0
+            self._stream.flush()
+        self._last_flush = time.monotonic()
+
+    def __getattr__(self, name: str):
+        return getattr(self._stream, name)
+
+
+# Newest Worker lines kept in the Live region in ConsoleUI.display_worker_step()
+_WORKER_LIVE_ROWS = 20
+# Redraws per second for the status-only spinners (Rich's default is 10)
+_SPINNER_FPS = 4
+
+# Fixed titles and rules, parsed once. Panel copies a Text title before
+# rendering, so sharing is safe; Rule truncates a Text title in place, so
+# rules keep markup strings (the Rule objects themselves are reusable).
+_USER_TITLE = Text.from_markup("[bold green]👤 You[/bold green]")
+_MANAGER_TITLE = Text.from_markup("[bold cyan]🧠 Manager[/bold cyan]")
+_WORKER_RULE = Rule("[dim]👷 Worker Execution[/dim]", style="dim")
+_END_RULE = Rule(style="dim")
+# /history role column markup (other roles are shown as-is)
+_HISTORY_ROLES = {
+    "user": "[user]👤 user[/user]",
+    "assistant": "[manager]🧠 manager[/manager]",
+    "tool": "[worker]👷 worker[/worker]",
+}
+
+
+@lru_cache(maxsize=128)
+def _markdown(content: str) -> Markdown:
+    """Parse content into a Markdown renderable, reusing recent parses.
+
+    Markdown parses in its constructor and renders from the parsed tokens
+    without mutating them, so one instance can be printed any number of times.
+    """
+    return Markdown(content)
+
+
+class _StepStatus:
+    """Compact-mode "Step N..." line for the Worker Live region.
+
+    Renders from ConsoleUI._current_step when the Live region refreshes, so a
+    new step only bumps a counter instead of re-rendering the region.
+    """
+
+    __slots__ = ("_ui", "tag")
+
+    def __init__(self, ui: "ConsoleUI", tag: str):
+        self._ui = ui
+        self.tag = tag
+
+    def __rich__(self) -> Text:
+        return self._ui.console.render_str(f"    [dim]{self.tag}Step {self._ui._current_step}...[/dim]")
 
 
 def _build_completer_from_tree(tree: dict[str, list[str] | None]) -> NestedCompleter:
@@ -99,9 +223,19 @@ class ConsoleUI:
             verbose_worker: If True, show detailed Worker output.
         """
         self.console = Console(theme=GORCHESTRATOR_THEME)
+        # Batch terminal writes, except for the legacy Windows console, which
+        # Rich renders through the console API rather than the file
+        self._out: _TerminalBuffer | None = None
+        if not self.console.legacy_windows:
+            self._out = _TerminalBuffer(sys.stdout)
+            self.console.file = self._out
         self.verbose_worker = verbose_worker
         self._current_step = 0
-        self._worker_lines = []
+        # Live region for streamed Worker lines (opened on the first line)
+        self._live: Live | None = None
+        self._live_rows: list[Text] = []
+        self._live_status: _StepStatus | None = None
+        self._live_lock = threading.Lock()
 
         # Setup prompt_toolkit session with persistent history and autocomplete
         self._prompt_session: PromptSession | None = None
@@ -262,7 +396,7 @@ class ConsoleUI:
         self.console.print()
         panel = Panel(
             Text(message, style="user"),
-            title="[bold green]👤 You[/bold green]",
+            title=_USER_TITLE,
             border_style="green",
             padding=(0, 1),
         )
@@ -278,25 +412,20 @@ class ConsoleUI:
 
     def display_manager_message(self, content: str):
         """Display Manager's response."""
+        self.flush()
         self.console.print()
 
-        # Render markdown content
-        try:
-            md = Markdown(content)
-            panel = Panel(
-                md,
-                title="[bold cyan]🧠 Manager[/bold cyan]",
-                border_style="cyan",
-                padding=(0, 1),
-            )
-        except Exception:
-            # Fallback to plain text
-            panel = Panel(
-                Text(content, style="manager"),
-                title="[bold cyan]🧠 Manager[/bold cyan]",
-                border_style="cyan",
-                padding=(0, 1),
-            )
+        # Render markdown content; plain text for empty or non-string content
+        if isinstance(content, str) and content:
+            body = _markdown(content)
+        else:
+            body = Text(str(content or ""), style="manager")
+        panel = Panel(
+            body,
+            title=_MANAGER_TITLE,
+            border_style="cyan",
+            padding=(0, 1),
+        )
 
         self.console.print(panel)
 
@@ -333,23 +462,15 @@ class ConsoleUI:
             # Build subtitle with metadata
             subtitle = f"[dim]{sm_response.model} | {sm_response.duration_seconds:.1f}s[/dim]"
 
-            try:
-                md = Markdown(sm_response.content)
-                panel = Panel(
-                    md,
-                    title=f"[bold yellow]🎯 Advisor: {sm_response.name}[/bold yellow]",
-                    subtitle=subtitle,
-                    border_style="yellow",
-                    padding=(0, 1),
-                )
-            except Exception:
-                panel = Panel(
-                    Text(sm_response.content),
-                    title=f"[bold yellow]🎯 Advisor: {sm_response.name}[/bold yellow]",
-                    subtitle=subtitle,
-                    border_style="yellow",
-                    padding=(0, 1),
-                )
+            content = sm_response.content
+            body = _markdown(content) if isinstance(content, str) and content else Text(str(content or ""))
+            panel = Panel(
+                body,
+                title=f"[bold yellow]🎯 Advisor: {sm_response.name}[/bold yellow]",
+                subtitle=subtitle,
+                border_style="yellow",
+                padding=(0, 1),
+            )
 
         self.console.print(panel)
 
@@ -375,23 +496,15 @@ class ConsoleUI:
         else:
             subtitle = f"[dim]{llm_response.model} | {llm_response.duration_seconds:.1f}s[/dim]"
 
-            try:
-                md = Markdown(llm_response.content)
-                panel = Panel(
-                    md,
-                    title=f"[bold magenta]🔮 Parallel LLM: {llm_response.name}[/bold magenta]",
-                    subtitle=subtitle,
-                    border_style="magenta",
-                    padding=(0, 1),
-                )
-            except Exception:
-                panel = Panel(
-                    Text(llm_response.content),
-                    title=f"[bold magenta]🔮 Parallel LLM: {llm_response.name}[/bold magenta]",
-                    subtitle=subtitle,
-                    border_style="magenta",
-                    padding=(0, 1),
-                )
+            content = llm_response.content
+            body = _markdown(content) if isinstance(content, str) and content else Text(str(content or ""))
+            panel = Panel(
+                body,
+                title=f"[bold magenta]🔮 Parallel LLM: {llm_response.name}[/bold magenta]",
+                subtitle=subtitle,
+                border_style="magenta",
+                padding=(0, 1),
+            )
 
         self.console.print(panel)
 
@@ -401,96 +514,165 @@ class ConsoleUI:
 
     def start_worker_section(self):
         """Start a new Worker output section."""
-        self._worker_lines = []
+        self._stop_worker_live()
         self._current_step = 0
         self.console.print()
-        self.console.print(Rule("[dim]👷 Worker Execution[/dim]", style="dim"))
+        self.console.print(_WORKER_RULE)
 
     def display_worker_step(self, entry: LogEntry, worker_name: str = "worker"):
         """
         Display a Worker step/output line.
 
+        Lines go into a Live region that re-renders at most 10 times a second,
+        instead of one print per line. The region keeps the newest
+        _WORKER_LIVE_ROWS lines; older ones are printed above it in batches,
+        so the scrollback still holds the full output. When output is not a
+        terminal, lines are printed directly and compact mode's step status
+        line is skipped.
+
         Args:
             entry: Parsed log entry from the Worker.
             worker_name: Name of the worker producing this output.
         """
-        # Store for summary
-        if isinstance(entry, AgentLogEntry):
-            self._worker_lines.append(entry)
+        if isinstance(entry, RawLogEntry):
+            # Compact mode never shows raw lines
+            if not self.verbose_worker:
+                return
+        elif entry.is_step or entry.is_error or entry.is_result or entry.is_cost:
+            # Compact mode shows only steps and errors
+            if not self.verbose_worker and not (entry.is_step or entry.is_error):
+                return
+        elif not self.verbose_worker or not entry.message:
+            # Other structured logs: verbose mode shows them if they carry a message
+            return
 
-        # In verbose mode, show everything
-        if self.verbose_worker:
-            self._display_worker_step_verbose(entry, worker_name)
-        else:
-            self._display_worker_step_compact(entry, worker_name)
+        # Worker logs can arrive in bursts of thousands of lines: batch writes
+        # until the result is shown or input is needed (see flush())
+        if self._out is not None:
+            self._out.start_batching()
 
-    def _display_worker_step_verbose(self, entry: LogEntry, worker_name: str = "worker"):
-        """Display Worker step in verbose mode."""
+        with self._live_lock:
+            status = self._live_status
+            # In verbose mode, show everything
+            if self.verbose_worker:
+                line = self._format_worker_step_verbose(entry, worker_name)
+            else:
+                line = self._format_worker_step_compact(entry, worker_name)
+            if not self._is_tty:
+                # Redirected output: no Live redraws or status line, just the lines
+                self._live_status = None
+                if line is not None:
+                    self.console.print(line)
+                return
+            if line is not None:
+                self._live_rows.append(self.console.render_str(line))
+            elif self._live is not None and self._live_status is status:
+                # Only the step counter moved: the next refresh shows it
+                return
+            self._update_worker_live()
+
+    @property
+    def _is_tty(self) -> bool:
+        """Whether output goes to a terminal (spinners and Live redraws are skipped otherwise)."""
+        return self.console.is_terminal
+
+    def _update_worker_live(self):
+        """Push the current rows and status line to the Live region (lock held)."""
+        if self._live is None:
+            self._live = Live(
+                console=self.console, refresh_per_second=10, transient=False,
+            )
+            self._live.start()
+        if len(self._live_rows) > _WORKER_LIVE_ROWS:
+            # Move the oldest half above the region in a single print
+            evicted = self._live_rows[:_WORKER_LIVE_ROWS // 2]
+            del self._live_rows[:_WORKER_LIVE_ROWS // 2]
+            self._live.console.print(Group(*evicted))
+        rows = self._live_rows
+        if self._live_status is not None:
+            rows = [*rows, self._live_status]
+        self._live.update(Group(*rows))
+
+    def _stop_worker_live(self):
+        """Close the Live region, leaving its rows (not the status line) on screen."""
+        with self._live_lock:
+            if self._live is None:
+                return
+            self._live.update(Group(*self._live_rows), refresh=True)
+            self._live.stop()
+            self._live = None
+            self._live_rows = []
+            self._live_status = None
+
+    def _format_worker_step_verbose(self, entry: LogEntry, worker_name: str = "worker") -> str | None:
+        """Markup for a Worker step in verbose mode (None = nothing to show)."""
         tag = f"[dim][{worker_name}][/dim] " if worker_name != "worker" else "    "
         if isinstance(entry, RawLogEntry):
             if entry.raw.strip():
-                self.console.print(f"{tag}[worker]{entry.raw}[/worker]")
-            return
+                return f"{tag}[worker]{entry.raw}[/worker]"
+            return None
 
         if entry.is_step:
             self._current_step = entry.step_number or self._current_step + 1
             message = entry.message or "Processing..."
-            self.console.print(f"{tag}[dim][Step {self._current_step}][/dim] {message}")
+            return f"{tag}[dim][Step {self._current_step}][/dim] {message}"
 
         elif entry.is_cost:
             cost = entry.cost
             if cost is not None:
-                self.console.print(f"{tag}[cost]$ {cost:.4f}[/cost]")
+                return f"{tag}[cost]$ {cost:.4f}[/cost]"
+            return None
 
         elif entry.is_error:
             message = entry.message or "Unknown error"
-            self.console.print(f"{tag}[error]{message}[/error]")
+            return f"{tag}[error]{message}[/error]"
 
         elif entry.is_result:
             message = entry.message or "Done"
-            self.console.print(f"{tag}[success]{message}[/success]")
+            return f"{tag}[success]{message}[/success]"
 
-        else:
-            self.console.print(f"{tag}[dim][{entry.log_type}] {entry.message or ''}[/dim]")
+        elif entry.message:
+            return f"{tag}[dim][{entry.log_type}] {entry.message}[/dim]"
+        return None
 
-    def _display_worker_step_compact(self, entry: LogEntry, worker_name: str = "worker"):
-        """Display Worker step in compact mode (minimal output)."""
+    def _format_worker_step_compact(self, entry: LogEntry, worker_name: str = "worker") -> str | None:
+        """Compact mode: steps only update the status line; errors are kept."""
         tag = f"[{worker_name}] " if worker_name != "worker" else ""
         if isinstance(entry, RawLogEntry):
-            return
+            return None
 
         if entry.is_step:
             self._current_step = entry.step_number or self._current_step + 1
-            self.console.print(f"    [dim]{tag}Step {self._current_step}...[/dim]", end="\r")
+            if self._live_status is None or self._live_status.tag != tag:
+                self._live_status = _StepStatus(self, tag)
 
         elif entry.is_error:
             message = entry.message or "Error occurred"
-            self.console.print(f"    [error]{tag}{message}[/error]")
+            return f"    [error]{tag}{message}[/error]"
+        return None
 
     def display_worker_result(self, result: Any, title: str = "Worker Result"):
         """Display the Worker's final result."""
         from ..core.worker import TaskResult, TaskStatus
 
-        self.console.print()  # Clear the step line
+        self._stop_worker_live()  # Drops the compact step line
+        self.console.print()
 
         if not isinstance(result, TaskResult):
             self.console.print(Panel(str(result), title=title, border_style="dim"))
+            self.flush()
             return
 
-        # Build compact result summary
-        content = Text()
-
-        if result.is_success:
-            content.append("✓ SUCCESS", style="success")
-        else:
-            content.append("✗ FAILED", style="error")
-
-        content.append(f"  |  Steps: {result.step_count}")
-        content.append(f"  |  Cost: ${result.total_cost:.4f}")
-        content.append(f"  |  Time: {result.duration_seconds:.1f}s")
-
+        # Build compact result summary in one markup string
+        status = "[success]✓ SUCCESS[/success]" if result.is_success else "[error]✗ FAILED[/error]"
+        markup = (
+            f"{status}  |  Steps: {result.step_count}"
+            f"  |  Cost: ${result.total_cost:.4f}"
+            f"  |  Time: {result.duration_seconds:.1f}s"
+        )
         if result.error_message:
-            content.append(f"\n[error]Error: {result.error_message}[/error]")
+            markup += f"\n[error]Error: {escape(result.error_message)}[/error]"
+        content = Text.from_markup(markup)
 
         border_style = "green" if result.is_success else "red"
         self.console.print(Panel(
@@ -499,10 +681,12 @@ class ConsoleUI:
             border_style=border_style,
             padding=(0, 1),
         ))
+        self.flush()
 
     def end_worker_section(self):
         """End Worker output section."""
-        self.console.print(Rule(style="dim"))
+        self.console.print(_END_RULE)
+        self.flush()
 
     # ================================================================
     # Input Methods
@@ -516,6 +700,7 @@ class ConsoleUI:
         Falls back to rich.Prompt if prompt_toolkit is unavailable.
         """
         self.console.print()
+        self.flush()
         if self._prompt_session is not None:
             try:
                 result = self._prompt_session.prompt(
@@ -556,12 +741,16 @@ class ConsoleUI:
 
     @contextmanager
     def spinner(self, text: str = "Working..."):
-        """Show a loading spinner."""
+        """Show a loading spinner (yields None without one when output is not a terminal)."""
+        if not self._is_tty:
+            yield None
+            return
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             console=self.console,
             transient=True,
+            refresh_per_second=_SPINNER_FPS,
         ) as progress:
             task = progress.add_task(text, total=None)
             yield progress
@@ -574,13 +763,17 @@ class ConsoleUI:
 
     @contextmanager
     def worker_progress(self):
-        """Show progress bar for Worker execution."""
+        """Show progress bar for Worker execution (yields None when output is not a terminal)."""
+        if not self._is_tty:
+            yield None
+            return
         with Progress(
             SpinnerColumn(),
             TextColumn("[dim]👷 Worker executing...[/dim]"),
             BarColumn(bar_width=20),
             console=self.console,
             transient=True,
+            refresh_per_second=_SPINNER_FPS,
         ) as progress:
             task = progress.add_task("", total=None)
             yield progress
@@ -589,6 +782,12 @@ class ConsoleUI:
     # Utility Methods
     # ================================================================
 
+    def flush(self):
+        """Close the Worker Live region and write out any buffered output."""
+        self._stop_worker_live()
+        if self._out is not None:
+            self._out.stop_batching()
+
     def print_separator(self, title: str = ""):
         """Print a horizontal rule/separator."""
         self.console.print()
@@ -611,8 +810,8 @@ class ConsoleUI:
         """Print a warning message."""
         self.console.print(f"[warning]⚠ Warning: {message}[/warning]")
 
-    def show_history(self, history: list[dict]):
-        """Display conversation history."""
+    def show_history(self, history: list[dict], max_rows: int = 50):
+        """Display conversation history (only the last max_rows entries; 0 = all)."""
         if not history:
             self.console.print("[dim]No history yet.[/dim]")
             return
@@ -623,22 +822,18 @@ class ConsoleUI:
         table.add_column("Content", overflow="fold")
         table.add_column("Tool?", width=5)
 
-        for i, entry in enumerate(history, 1):
+        start = 0
+        if 0 < max_rows < len(history):
+            start = len(history) - max_rows
+            table.add_row("", "", f"[dim]... {start} earlier entries omitted ...[/dim]", "")
+
+        for i, entry in enumerate(history[start:], start + 1):
             role = entry.get("role", "unknown")
-            content = entry.get("content", "")[:60]
-            if len(entry.get("content", "")) > 60:
-                content += "..."
+            content = entry.get("content") or ""
+            if len(content) > 60:
+                content = content[:60] + "..."
             has_tool = "✓" if entry.get("has_tool_calls") else ""
-
-            # Role styling
-            if role == "user":
-                role_display = "[user]👤 user[/user]"
-            elif role == "assistant":
-                role_display = "[manager]🧠 manager[/manager]"
-            elif role == "tool":
-                role_display = "[worker]👷 worker[/worker]"
-            else:
-                role_display = role
+            role_display = _HISTORY_ROLES.get(role, role)
 
             table.add_row(str(i), role_display, content, has_tool)
 
@@ -650,6 +845,8 @@ class ConsoleUI:
             self.console.print("[dim]No history yet.[/dim]")
             return
 
+        # Render all panels in one print: one console lock/flush, not one per message
+        panels = []
         for i, entry in enumerate(history, 1):
             role = entry.get("role", "unknown")
             content = entry.get("content", "")
@@ -675,16 +872,19 @@ class ConsoleUI:
                 except Exception:
                     pass
 
-            try:
-                body = Markdown(content) if role == "assistant" else Text(content)
-            except Exception:
-                body = Text(content)
+            if role == "assistant" and isinstance(content, str) and content:
+                body = _markdown(content)
+            else:
+                body = Text(str(content or ""))
+
+            panels.append(Panel(body, title=title, border_style=border, padding=(0, 1)))
 
-            self.console.print(Panel(body, title=title, border_style=border, padding=(0, 1)))
+        self.console.print(Group(*panels))
 
     def confirm(self, message: str, default: bool = False) -> bool:
         """Ask for yes/no confirmation."""
         from rich.prompt import Confirm
+        self.flush()
         return Confirm.ask(message, default=default, console=self.console)
 
     def clear(self):
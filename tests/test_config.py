@@ -57,6 +57,34 @@ class TestSettings:
         assert env["MINI_API_KEY"] == "sk-proxy"
         assert len(env) == 2  # Only MINI_API_BASE and MINI_API_KEY
 
+    def test_agent_env_is_read_only_and_cached(self):
+        settings = Settings(
+            _env_file=None,
+            PROXY_URL="http://test:8045/",
+            PROXY_KEY="sk-proxy",
+            ORCHESTRATOR_API_KEY="test",
+        )
+        env = settings.agent_env
+        assert env["MINI_API_BASE"] == "http://test:8045"
+        assert settings.agent_env is env
+        with pytest.raises(TypeError):
+            env["MINI_API_KEY"] = "other"
+
+    def test_cached_values_invalidated_on_field_change(self):
+        settings = Settings(
+            _env_file=None,
+            AGENT_PATH="/absolute/one",
+            PROXY_URL="http://old:1",
+            ORCHESTRATOR_API_KEY="test",
+            PROXY_KEY="test",
+        )
+        assert settings.agent_path_resolved.name == "one"
+        assert settings.agent_env["MINI_API_BASE"] == "http://old:1"
+        settings.AGENT_PATH = "/absolute/two"
+        settings.PROXY_URL = "http://new:2"
+        assert settings.agent_path_resolved.name == "two"
+        assert settings.agent_env["MINI_API_BASE"] == "http://new:2"
+
     def test_get_orchestrator_config(self):
         settings = Settings(
             _env_file=None,
@@ -233,3 +261,32 @@ class TestProviderDetection:
         assert "ANTHROPIC_API_KEY" not in env
         assert "OPENAI_API_KEY" not in env
         assert "LITELLM_API_KEY" not in env
+
+
+class TestLazyCoreNamespace:
+    """Tests for the lazy public namespace in src.core."""
+
+    def test_import_core_does_not_load_engine(self):
+        import subprocess
+        import sys
+        code = (
+            "import sys, src.core; "
+            "print('src.core.engine' in sys.modules, 'litellm' in sys.modules)"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).resolve().parent.parent,
+            capture_output=True, text=True, check=True,
+        ).stdout.split()
+        assert out == ["False", "False"]
+
+    def test_lazy_name_resolves_to_submodule_object(self):
+        import src.core as core
+        from src.core.engine import SessionEngine
+        assert core.SessionEngine is SessionEngine
+        assert "SessionEngine" in dir(core)
+
+    def test_unknown_name_raises_attribute_error(self):
+        import src.core as core
+        with pytest.raises(AttributeError):
+            core.DoesNotExist
@@ -0,0 +1,220 @@
+"""Tests for the Console UI output buffering."""
+
+import io
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from rich.console import Console
+
+from src.core.worker import TaskResult, TaskStatus
+from src.ui.console import ConsoleUI, _TerminalBuffer
+from src.utils.parser import parse_log_line
+
+
+@pytest.fixture
+def out():
+    return io.StringIO()
+
+
+@pytest.fixture
+def ui(tmp_path, monkeypatch):
+    """ConsoleUI rendering into a StringIO, with its input history under tmp_path."""
+    monkeypatch.setattr(ConsoleUI, "_HISTORY_DIR", tmp_path)
+    console_ui = ConsoleUI()
+    console_ui.console = Console(file=io.StringIO(), width=120)
+    return console_ui
+
+
+@pytest.fixture
+def tty_ui(ui):
+    """Like ui, but the console reports a terminal (Live regions are used)."""
+    ui.console = Console(file=io.StringIO(), width=120, force_terminal=True)
+    return ui
+
+
+def _step(i: int):
+    return parse_log_line('{"type": "step", "step": %d, "message": "msg %d"}' % (i, i))
+
+
+class TestTerminalBuffer:
+    """Tests for _TerminalBuffer batching of Rich's write()+flush() calls."""
+
+    def test_writes_through_when_not_batching(self, out):
+        buf = _TerminalBuffer(out, max_delay=60)
+        for line in ("a\n", "b\n"):
+            buf.write(line)
+            buf.flush()
+        assert out.getvalue() == "a\nb\n"
+
+    def test_first_flush_after_idle_is_immediate(self, out):
+        buf = _TerminalBuffer(out)
+        buf.start_batching()
+        buf.write("hello\n")
+        buf.flush()
+        assert out.getvalue() == "hello\n"
+
+    def test_burst_is_coalesced_and_flushed_by_timer(self, out):
+        buf = _TerminalBuffer(out, max_delay=0.05)
+        buf.start_batching()
+        buf.write("first\n")
+        buf.flush()
+        for i in range(3):
+            buf.write(f"line {i}\n")
+            buf.flush()
+        assert out.getvalue() == "first\n"
+        time.sleep(0.3)
+        assert out.getvalue() == "first\nline 0\nline 1\nline 2\n"
+
+    def test_size_limit_and_stop_batching(self, out):
+        buf = _TerminalBuffer(out, max_chars=10, max_delay=60)
+        buf.start_batching()
+        buf.flush_now()
+        buf.write("short")
+        buf.flush()
+        assert out.getvalue() == ""
+        buf.write("-and-longer")
+        buf.flush()
+        assert out.getvalue() == "short-and-longer"
+        buf.write("tail")
+        buf.stop_batching()
+        assert out.getvalue() == "short-and-longertail"
+
+    def test_writes_are_capped_at_max_chars(self):
+        stream = MagicMock()
+        buf = _TerminalBuffer(stream, max_chars=4)
+        buf.write("abcdefghij")
+        buf.flush()
+        assert [c.args[0] for c in stream.write.call_args_list] == ["abcd", "efgh", "ij"]
+
+    def test_timer_does_not_block_exit(self, out):
+        buf = _TerminalBuffer(out, max_delay=60)
+        buf.start_batching()
+        buf.flush_now()
+        buf.write("pending")
+        buf.flush()
+        assert buf._timer.daemon
+        buf.stop_batching()
+
+    def test_delegates_stream_attributes(self, out):
+        buf = _TerminalBuffer(out)
+        assert buf.isatty() is False
+
+
+class TestWorkerLiveRegion:
+    """Tests for ConsoleUI's Live region for streamed Worker lines."""
+
+    def test_verbose_keeps_every_line_in_order(self, ui):
+        ui.verbose_worker = True
+        for i in range(1, 46):
+            ui.display_worker_step(_step(i))
+        ui.flush()
+        lines = [line.strip() for line in ui.console.file.getvalue().splitlines()]
+        assert lines == [f"[Step {i}] msg {i}" for i in range(1, 46)]
+        assert ui._live is None
+
+    def test_compact_skips_entries_it_would_not_show(self, ui):
+        ui.display_worker_step(parse_log_line("plain output"))
+        ui.display_worker_step(parse_log_line('{"type": "info", "message": "hidden"}'))
+        ui.display_worker_step(parse_log_line('{"type": "cost", "total": 0.1}'))
+        assert ui._live is None
+        assert ui.console.file.getvalue() == ""
+
+    def test_verbose_skips_empty_generic_entries(self, ui):
+        ui.verbose_worker = True
+        ui.display_worker_step(parse_log_line('{"type": "info"}'))
+        assert ui._live is None
+        ui.display_worker_step(parse_log_line('{"type": "info", "message": "shown"}'))
+        ui.flush()
+        assert "shown" in ui.console.file.getvalue()
+
+    def test_compact_drops_step_status_on_result(self, ui):
+        ui.display_worker_step(_step(1))
+        ui.display_worker_step(parse_log_line('{"type": "error", "message": "boom"}'))
+        ui.display_worker_result(TaskResult(status=TaskStatus.SUCCESS, exit_code=0))
+        out = ui.console.file.getvalue()
+        assert "boom" in out
+        assert "Step 1..." not in out
+        assert "SUCCESS" in out
+
+    def test_live_region_on_terminal(self, tty_ui):
+        tty_ui.display_worker_step(_step(1))
+        assert tty_ui._live is not None
+        assert tty_ui._live_status is not None
+        tty_ui.flush()
+        assert tty_ui._live is None
+
+    def test_compact_steps_only_bump_the_status_counter(self, tty_ui):
+        tty_ui.display_worker_step(_step(1))
+        with patch.object(tty_ui._live, "update", wraps=tty_ui._live.update) as update:
+            for i in range(2, 50):
+                tty_ui.display_worker_step(_step(i))
+        assert update.call_count == 0
+        assert tty_ui._live_status.__rich__().plain == "    Step 49..."
+        tty_ui.flush()
+
+    def test_redirected_output_prints_lines_without_status(self, ui):
+        ui.display_worker_step(_step(1))
+        ui.display_worker_step(parse_log_line('{"type": "error", "message": "boom"}'))
+        assert ui._live is None and ui._live_status is None
+        out = ui.console.file.getvalue()
+        assert out.strip() == "boom"
+        assert "\x1b" not in out
+
+
+class TestMessagePanels:
+    """Tests for Markdown/plain-text selection in ConsoleUI panels."""
+
+    def test_manager_message_markdown_and_empty(self, ui):
+        ui.display_manager_message("**bold** reply")
+        ui.display_manager_message("")
+        ui.display_manager_message(None)
+        out = ui.console.file.getvalue()
+        assert "bold reply" in out
+        assert "**" not in out
+        assert out.count("Manager") == 3
+
+    def test_worker_result_summary(self, ui):
+        ui.display_worker_result(TaskResult(
+            status=TaskStatus.FAILED, exit_code=1, step_count=2, total_cost=0.5,
+            duration_seconds=3.0, error_message="bad [value]",
+        ))
+        out = ui.console.file.getvalue()
+        assert "✗ FAILED  |  Steps: 2  |  Cost: $0.5000  |  Time: 3.0s" in out
+        assert "Error: bad [value]" in out
+        assert "[error]" not in out
+
+    def test_show_history_windows_long_lists(self, ui):
+        history = [{"role": "user", "content": f"message-{i}"} for i in range(1, 8)]
+        ui.show_history(history, max_rows=3)
+        out = ui.console.file.getvalue()
+        assert "4 earlier entries omitted" in out
+        assert "message-4" not in out
+        assert "message-5" in out and "message-7" in out
+
+    def test_show_history_roles_and_missing_content(self, ui):
+        ui.show_history([
+            {"role": "assistant", "content": None, "has_tool_calls": True},
+            {"role": "tool", "content": "x" * 61},
+            {"role": "system", "content": "sys"},
+        ])
+        out = ui.console.file.getvalue()
+        assert "manager" in out and "worker" in out and "system" in out
+        assert "x" * 60 + "..." in out
+
+
+class TestSpinner:
+    """Tests for the spinner/progress contexts."""
+
+    def test_no_spinner_when_not_a_terminal(self, ui):
+        with ui.spinner("quiet") as spinner, ui.worker_progress() as progress:
+            pass
+        with ui.manager_thinking_spinner():
+            pass
+        assert spinner is None and progress is None
+        assert ui.console.file.getvalue() == ""
+
+    def test_spinner_on_terminal(self, tty_ui):
+        with tty_ui.spinner("busy") as spinner, tty_ui.worker_progress() as progress:
+            assert spinner is not None and progress is not None
+            assert spinner.live.refresh_per_second == progress.live.refresh_per_second == 4
@@ -18,8 +18,15 @@ class TestSessionEngine:
         with patch("src.core.engine.write_env_value"):
             yield
 
+    @pytest.fixture(autouse=True)
+    def _isolate_project_root(self, tmp_path, monkeypatch):
+        """Keep registries and sessions created by SessionEngine out of the real project root."""
+        monkeypatch.setattr(SessionEngine, "_PROJECT_ROOT", tmp_path)
+        monkeypatch.setattr(SessionEngine, "SESSIONS_DIR", tmp_path / "sessions")
+
     def _make_engine(self, tmp_path):
         settings = MagicMock()
+        settings.WORKER_CACHE_TTL = 0
         settings.ORCHESTRATOR_MODEL = "test-model"
         settings.ORCHESTRATOR_API_BASE = "http://localhost:8045"
         settings.ORCHESTRATOR_API_KEY = "sk-test"
@@ -72,6 +79,16 @@ class TestSessionEngine:
         assert "session_id" in data
         assert data["session_name"] == "test_session"
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_session_json_roundtrip_with_and_without_orjson(self, tmp_path, use_orjson):
+        import src.core.engine as engine_mod
+        backend = engine_mod.orjson if use_orjson else None
+        with patch.object(engine_mod, "orjson", backend):
+            path = tmp_path / "s.json"
+            engine_mod._write_json_file(path, {"content": "çalışıyor", "n": [1, 2]})
+            assert "çalışıyor" in path.read_text(encoding="utf-8")
+            assert engine_mod._read_json_file(path) == {"content": "çalışıyor", "n": [1, 2]}
+
     def test_new_session_creates_unique_id(self, tmp_path):
         engine = self._make_engine(tmp_path)
         sid1 = engine._new_session("First")
@@ -131,6 +148,14 @@ class TestSessionEngine:
         result = engine._handle_slash_command("/help")
         assert result is True
 
+    def test_show_help_reuses_parsed_markdown(self, tmp_path):
+        engine = self._make_engine(tmp_path)
+        engine.ui.console = MagicMock()
+        engine._show_help()
+        engine._show_help()
+        first, second = (c.args[0] for c in engine.ui.console.print.call_args_list)
+        assert first is second
+
     def test_handle_slash_command_verbose(self, tmp_path):
         engine = self._make_engine(tmp_path)
         result = engine._handle_slash_command("/verbose")
@@ -284,6 +309,63 @@ class TestSessionEngine:
         assert "summary" in s
         assert "messages" in s
 
+    def test_list_sessions_legacy_and_non_session_entries(self, tmp_path):
+        engine = self._make_engine(tmp_path)
+        (engine.SESSIONS_DIR / "legacy_one.json").write_text(
+            json.dumps({"session_name": "Old", "message_count": 3}), encoding="utf-8"
+        )
+        (engine.SESSIONS_DIR / "empty_dir").mkdir()
+        (engine.SESSIONS_DIR / "notes.txt").write_text("ignore me", encoding="utf-8")
+        sessions = engine.list_sessions()
+        assert [s["session_id"] for s in sessions] == ["legacy_one"]
+        assert sessions[0]["name"] == "Old"
+        assert sessions[0]["messages"] == 3
+
+    def test_load_session_reuses_unchanged_file(self, tmp_path):
+        import src.core.engine as engine_mod
+        engine = self._make_engine(tmp_path)
+        engine._init_manager()
+        engine._new_session("Cache Test")
+        path = engine.save_session()
+
+        with patch.object(engine_mod, "_read_json_file", wraps=engine_mod._read_json_file) as reader:
+            assert engine.load_session(engine.session_id)
+            assert engine.load_session(engine.session_id)
+            assert reader.call_count == 1
+
+            # A changed file is parsed again
+            data = json.loads(path.read_text(encoding="utf-8"))
+            data["session_name"] = "Renamed On Disk"
+            path.write_text(json.dumps(data), encoding="utf-8")
+            assert engine.load_session(engine.session_id)
+            assert reader.call_count == 2
+            assert engine.session_name == "Renamed On Disk"
+
+    def test_session_cache_is_bounded(self, tmp_path):
+        import shutil
+        engine = self._make_engine(tmp_path)
+        engine._init_manager()
+        ids = []
+        for i in range(engine._SESSION_CACHE_SIZE + 2):
+            engine._new_session(f"S{i}")
+            engine.save_session()
+            ids.append(engine.session_id)
+        for sid in ids:
+            assert engine.load_session(sid)
+        assert len(engine._session_cache) == engine._SESSION_CACHE_SIZE
+
+        # Listing caches only the metadata fields, not the histories
+        engine.list_sessions()
+        assert len(engine._session_meta) == len(ids)
+        assert all("manager_history" not in meta for _, _, meta in engine._session_meta.values())
+
+        # A session removed from disk is dropped from both caches
+        shutil.rmtree(engine.SESSIONS_DIR / ids[-1])
+        engine.list_sessions()
+        gone = engine.SESSIONS_DIR / ids[-1] / "session.json"
+        assert gone not in engine._session_meta
+        assert gone not in engine._session_cache
+
     def test_load_corrupted_session(self, tmp_path):
         engine = self._make_engine(tmp_path)
         # Write invalid JSON in session directory format
@@ -301,6 +383,176 @@ class TestSessionEngine:
         session_dir = engine.SESSIONS_DIR / engine.session_id
         assert (session_dir / "session.json").exists()
 
+    def test_save_session_creates_dir_once(self, tmp_path):
+        engine = self._make_engine(tmp_path)
+        engine._init_manager()
+        engine._new_session("Mkdir Test")
+        engine.save_session()
+        with patch.object(Path, "mkdir") as mock_mkdir:
+            engine.save_session()
+        mock_mkdir.assert_not_called()
+
+    def _add_user_message(self, engine, content):
+        from src.core.manager import Message, MessageRole
+        engine.manager.messages.append(Message(role=MessageRole.USER, content=content))
+
+    def test_auto_save_appends_to_journal(self, tmp_path):
+        engine = self._make_engine(tmp_path)
+        engine._init_manager()
+        engine._new_session("Journal Test")
+        engine._auto_save()  # First save writes the snapshot
+        session_dir = engine.SESSIONS_DIR / engine.session_id
+        snapshot = (session_dir / "session.json").read_bytes()
+
+        self._add_user_message(engine, "first")
+        engine._auto_save()
+        self._add_user_message(engine, "second")
+        engine._auto_save()
+
+        # Snapshot untouched; new messages journaled one per line
+        assert (session_dir / "session.json").read_bytes() == snapshot
+        lines = (session_dir / "journal.jsonl").read_text(encoding="utf-8").splitlines()
+        # Header sequence follows the one the snapshot folded in
+        assert json.loads(lines[0]) == {"journal_seq": json.loads(snapshot)["journal_seq"] + 1}
+        assert [json.loads(line)["content"] for line in lines[1:]] == ["first", "second"]
+
+    def test_load_session_replays_journal(self, tmp_path):
+        engine = self._make_engine(tmp_path)
+        engine._init_manager()
+        engine._new_session("Replay Test")
+        engine._auto_save()
+        self._add_user_message(engine, "journaled")
+        engine._auto_save()
+        # Simulate a torn final record from an interrupted append
+        journal = engine.SESSIONS_DIR / engine.session_id / "journal.jsonl"
+        with open(journal, "ab") as f:
+            f.write(b'{"role": "user", "cont')
+
+        engine2 = self._make_engine(tmp_path)
+        engine2._init_manager()
+        assert engine2.load_session(engine.session_id)
+        contents = [m.content for m in engine2.manager.messages if m.role.value == "user"]
+        assert contents == ["journaled"]
+
+    def test_list_sessions_counts_journaled_messages(self, tmp_path):
+        engine = self._make_engine(tmp_path)
+        engine._init_manager()
+        engine._new_session("Listing Test")
+        engine._auto_save()
+        for i in range(5):
+            self._add_user_message(engine, f"turn {i}")
+            engine._auto_save()
+
+        info = next(s for s in engine.list_sessions() if s["session_id"] == engine.session_id)
+        assert info["messages"] == len(engine.manager.messages)
+        assert info["summary"] == "turn 4"
+
+    def test_load_skips_journal_already_in_snapshot(self, tmp_path):
+        engine = self._make_engine(tmp_path)
+        engine._init_manager()
+        engine._new_session("Crash Test")
+        engine._auto_save()
+        self._add_user_message(engine, "journaled")
+        engine._auto_save()
+        journal = engine.SESSIONS_DIR / engine.session_id / "journal.jsonl"
+        leftover = journal.read_bytes()
+
+        # The process dies after writing the snapshot but before removing the journal
+        engine.save_session()
+        journal.write_bytes(leftover)
+
+        engine2 = self._make_engine(tmp_path)
+        engine2._init_manager()
+        assert engine2.load_session(engine.session_id)
+        contents = [m.content for m in engine2.manager.messages if m.role.value == "user"]
+        assert contents == ["journaled"]
+        assert not journal.exists()
+
+        # Later appends start a fresh journal that is replayed
+        self._add_user_message(engine2, "after crash")
+        engine2._auto_save()
+        engine3 = self._make_engine(tmp_path)
+        engine3._init_manager()
+        assert engine3.load_session(engine.session_id)
+        contents = [m.content for m in engine3.manager.messages if m.role.value == "user"]
+        assert contents == ["journaled", "after crash"]
+
+    def test_auto_save_after_loading_legacy_session(self, tmp_path):
+        engine = self._make_engine(tmp_path)
+        engine._init_manager()
+        (engine.SESSIONS_DIR / "legacy_one.json").write_text(json.dumps({
+            "session_id": "legacy_one",
+            "session_name": "Old",
+            "manager_history": [{"role": "user", "content": "old turn"}],
+        }), encoding="utf-8")
+        assert engine.load_session("legacy_one")
+
+        for i in range(3):
+            self._add_user_message(engine, f"turn {i}")
+            engine._auto_save()
+
+        engine2 = self._make_engine(tmp_path)
+        engine2._init_manager()
+        assert engine2.load_session("legacy_one")
+        contents = [m.content for m in engine2.manager.messages if m.role.value == "user"]
+        assert contents == ["old turn", "turn 0", "turn 1", "turn 2"]
+
+    def test_auto_save_compacts_journal(self, tmp_path):
+        engine = self._make_engine(tmp_path)
+        engine._init_manager()
+        engine._new_session("Compact Test")
+        engine._auto_save()
+        session_dir = engine.SESSIONS_DIR / engine.session_id
+
+        for i in range(engine._SNAPSHOT_EVERY):
+            self._add_user_message(engine, f"msg {i}")
+            engine._auto_save()
+
+        # The last save rolled the journal into a fresh snapshot
+        assert not (session_dir / "journal.jsonl").exists()
+        data = json.loads((session_dir / "session.json").read_text(encoding="utf-8"))
+        user_msgs = [m for m in data["manager_history"] if m["role"] == "user"]
+        assert len(user_msgs) == engine._SNAPSHOT_EVERY
+
+    def test_auto_save_snapshots_after_history_rewrite(self, tmp_path):
+        engine = self._make_engine(tmp_path)
+        engine._init_manager()
+        engine._new_session("Rewrite Test")
+        self._add_user_message(engine, "before clear")
+        engine._auto_save()
+        engine.manager.clear_history()
+        self._add_user_message(engine, "after clear")
+        engine._auto_save()
+
+        session_dir = engine.SESSIONS_DIR / engine.session_id
+        assert not (session_dir / "journal.jsonl").exists()
+        data = json.loads((session_dir / "session.json").read_text(encoding="utf-8"))
+        contents = [m["content"] for m in data["manager_history"] if m["role"] == "user"]
+        assert contents == ["after clear"]
+
+    def test_auto_save_snapshots_after_trim(self, tmp_path):
+        engine = self._make_engine(tmp_path)
+        engine._init_manager()
+        engine._new_session("Trim Test")
+        engine._auto_save()
+        for i in range(4):
+            self._add_user_message(engine, f"turn {i}")
+            engine._auto_save()
+
+        # Trimming keeps the last message, but the ones before it moved
+        engine.manager.settings.MAX_CONVERSATION_MESSAGES = 3
+        engine.manager._trim_history()
+        self._add_user_message(engine, "after trim")
+        engine._auto_save()
+
+        session_dir = engine.SESSIONS_DIR / engine.session_id
+        assert not (session_dir / "journal.jsonl").exists()
+        engine2 = self._make_engine(tmp_path)
+        engine2._init_manager()
+        assert engine2.load_session(engine.session_id)
+        contents = [m.content for m in engine2.manager.messages if m.role.value == "user"]
+        assert contents == ["turn 2", "turn 3", "after trim"]
+
     # ================================================================
     # /clearterminal test
     # ================================================================
@@ -320,6 +572,51 @@ class TestSessionEngine:
         result = engine._handle_slash_command("/ct")
         assert result is True
 
+    @pytest.mark.parametrize("message,expected", [
+        ("Connection refused by host", "Cannot connect"),
+        ("HTTP 401: invalid API_KEY", "API key rejected"),
+        ("Model gpt-x returned 404", "not found at"),
+        ("model unavailable: connection reset", "Cannot connect"),
+        # Priority holds regardless of where each keyword appears
+        ("auth header sent, then connection refused", "Cannot connect"),
+        ("404 model missing after 401 auth", "API key rejected"),
+        # Overlapping keywords: "404" and "401" share characters
+        ("upstream status 40401", "API key rejected"),
+        ("something else broke", "Unexpected error"),
+    ])
+    def test_process_user_message_classifies_errors(self, tmp_path, message, expected):
+        engine = self._make_engine(tmp_path)
+        engine._init_manager()
+        engine.ui = MagicMock()
+        engine.manager.chat = MagicMock(side_effect=RuntimeError(message))
+        engine._process_user_message("hi")
+        assert expected in engine.ui.print_error.call_args[0][0]
+
+    def test_error_messages_use_current_settings(self, tmp_path):
+        engine = self._make_engine(tmp_path)
+        engine._init_manager()
+        engine.ui = MagicMock()
+        engine.settings.ORCHESTRATOR_MODEL = "changed-model"
+        engine.manager.chat = MagicMock(side_effect=RuntimeError("404 model missing"))
+        engine._process_user_message("hi")
+        assert "Model 'changed-model' not found at http://localhost:8045" in engine.ui.print_error.call_args[0][0]
+
+        engine.manager.chat = MagicMock(side_effect=ConnectionError())
+        engine._process_user_message("hi")
+        assert "proxy is running at: http://localhost:8045" in engine.ui.print_error.call_args[0][0]
+
+    def test_legacy_command_dispatch(self, tmp_path):
+        engine = self._make_engine(tmp_path)
+        engine._init_manager()
+        assert engine._handle_slash_command("/nonexistent") is False
+        # Alias resolves and the (stripped) argument reaches the handler
+        engine._handle_slash_command("/S   Named Save  ")
+        assert engine.session_name == "Named Save"
+        # Any whitespace separates the argument, as from a pasted tab
+        assert engine._handle_slash_command("/s\tTabbed Save")
+        assert engine.session_name == "Tabbed Save"
+        assert engine._handle_slash_command("/load\n" + engine.session_id)
+
     # ================================================================
     # /new random name test
     # ================================================================
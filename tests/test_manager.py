@@ -11,7 +11,23 @@ from src.core.manager import (
     ManagerResponse,
     Message,
     MessageRole,
+    ToolCallCache,
 )
+from src.core.worker import TaskResult, TaskStatus
+
+
+@pytest.fixture(autouse=True)
+def _isolate_project_state(tmp_path, monkeypatch):
+    """Keep SessionEngine registries and sessions out of the real project root."""
+    from src.core.engine import SessionEngine
+    monkeypatch.setattr(SessionEngine, "_PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(SessionEngine, "SESSIONS_DIR", tmp_path / ".gorchestrator" / "sessions")
+    monkeypatch.setattr(SessionEngine, "_LAST_SESSION_FILE", tmp_path / ".gorchestrator" / "last_session_id")
+    # Engines here use bare MagicMock settings, so seed the default worker up front
+    from src.core.worker_registry import WorkerRegistry
+    WorkerRegistry(tmp_path / ".gorchestrator" / "workers.json").ensure_default(
+        model="test-model", profile="live",
+    )
 
 
 class TestMessage:
@@ -45,6 +61,13 @@ class TestMessage:
         assert d["tool_call_id"] == "call_123"
         assert d["name"] == "delegate_to_worker"
 
+    def test_to_dict_is_cached_and_message_immutable(self):
+        import dataclasses
+        msg = Message(role=MessageRole.USER, content="Hello")
+        assert msg.to_dict() is msg.to_dict()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            msg.content = "changed"
+
     def test_timestamp_auto_generated(self):
         msg = Message(role=MessageRole.USER, content="test")
         assert msg.timestamp is not None
@@ -67,6 +90,7 @@ class TestManagerAgent:
 
     def _make_agent(self):
         settings = MagicMock()
+        settings.WORKER_CACHE_TTL = 0
         settings.ORCHESTRATOR_MODEL = "test-model"
         settings.ORCHESTRATOR_API_BASE = "http://localhost:8045"
         settings.ORCHESTRATOR_API_KEY = "sk-test"
@@ -99,6 +123,82 @@ class TestManagerAgent:
         assert len(agent.messages) == 1
         assert agent.messages[0].role == MessageRole.SYSTEM
 
+    def test_set_system_prompt_replaces_system_message(self):
+        agent = self._make_agent()
+        agent.messages.append(Message(role=MessageRole.USER, content="hi"))
+        agent.set_system_prompt("Custom prompt")
+        assert agent.messages[0].role == MessageRole.SYSTEM
+        assert agent.messages[0].to_dict()["content"] == "Custom prompt"
+        assert len(agent.messages) == 2
+
+    def test_parallel_tool_calls_keep_call_order(self):
+        import time as _time
+        agent = self._make_agent()
+
+        def fake_execute(tc):
+            # The first call finishes last
+            _time.sleep(0.05 if tc["id"] == "call_b" else 0.0)
+            msg = Message(role=MessageRole.TOOL, content=tc["id"], tool_call_id=tc["id"])
+            return TaskResult(status=TaskStatus.SUCCESS, exit_code=0, output_lines=[tc["id"]]), msg
+
+        calls = [{"id": "call_b", "function": {"name": "delegate_to_worker"}},
+                 {"id": "call_a", "function": {"name": "delegate_to_worker"}}]
+        with patch.object(agent, "_execute_single_tool_call", side_effect=fake_execute):
+            results = agent._handle_tool_calls(calls)
+        assert [r.output_lines[0] for r in results] == ["call_b", "call_a"]
+        assert [m.tool_call_id for m in agent.messages[1:]] == ["call_b", "call_a"]
+
+    def test_chat_dumps_each_tool_call_once(self):
+        agent = self._make_agent()
+        tc = MagicMock()
+        tc.model_dump.return_value = {"id": "call_1", "type": "function",
+                                      "function": {"name": "delegate_to_worker", "arguments": "{}"}}
+        first = MagicMock()
+        first.choices[0].message.content = ""
+        first.choices[0].message.tool_calls = [tc]
+        final = MagicMock()
+        final.choices[0].message.content = "done"
+        final.choices[0].message.tool_calls = None
+        seen = []
+
+        def fake_handle(calls):
+            seen.extend(calls)
+            return []
+
+        with patch.object(agent, "_call_llm", side_effect=[first, final]), \
+                patch.object(agent, "_handle_tool_calls", side_effect=fake_handle):
+            response = agent.chat("go")
+        assert response.content == "done"
+        tc.model_dump.assert_called_once()
+        assistant = [m for m in agent.messages if m.tool_calls][0]
+        assert seen[0] is assistant.tool_calls[0]
+
+    @pytest.mark.parametrize("text, expected", [
+        ("hi", False),
+        ("Thanks!", False),
+        ("thank you.", False),
+        ("yes", True),
+        ("hi, please fix app.py", True),
+    ])
+    def test_should_include_tools(self, text, expected):
+        agent = self._make_agent()
+        assert agent._should_include_tools(text) is expected
+
+    def test_small_talk_keeps_tools_after_tool_history(self):
+        agent = self._make_agent()
+        agent._append_message(Message(role=MessageRole.ASSISTANT, content="",
+                                      tool_calls=[{"id": "c1", "function": {"name": "delegate_to_worker"}}]))
+        assert agent._should_include_tools("thanks") is True
+
+    def test_chat_small_talk_skips_tools(self):
+        agent = self._make_agent()
+        reply = MagicMock()
+        reply.choices[0].message.content = "Hello!"
+        reply.choices[0].message.tool_calls = None
+        with patch.object(agent, "_call_llm", return_value=reply) as call:
+            agent.chat("hello")
+        call.assert_called_once_with(include_tools=False)
+
     def test_export_import_history_no_duplicate_system(self):
         agent = self._make_agent()
         agent.messages.append(Message(role=MessageRole.USER, content="hello"))
@@ -110,6 +210,39 @@ class TestManagerAgent:
         assert len(system_msgs) == 1
         assert _BASE_SYSTEM_PROMPT in system_msgs[0].content
 
+    def test_wire_messages_track_history(self):
+        agent = self._make_agent()
+        agent.settings.MAX_CONVERSATION_MESSAGES = 3
+        wire = agent._wire_messages()
+        for i in range(4):
+            agent._append_message(Message(role=MessageRole.USER, content=f"m{i}"))
+        assert agent._wire_messages() is wire
+        agent._trim_history()
+        assert agent._wire_in_sync()
+        assert agent._wire_messages() == [m.to_dict() for m in agent.messages]
+        assert [m["content"] for m in agent._wire_messages()[1:]] == ["m2", "m3"]
+
+        # Direct edits fall back to a rebuild
+        agent.messages.append(Message(role=MessageRole.USER, content="direct"))
+        agent.set_system_prompt("new prompt")
+        assert agent._wire_messages() == [m.to_dict() for m in agent.messages]
+        assert agent._wire_messages()[0]["content"] == "new prompt"
+
+        # Replacing a message in the middle is caught too
+        agent.messages[2] = Message(role=MessageRole.USER, content="replaced")
+        assert not agent._wire_in_sync()
+        assert agent._wire_messages()[2]["content"] == "replaced"
+
+    @patch("src.core.manager.litellm")
+    def test_call_llm_does_not_share_cached_dicts(self, mock_litellm):
+        agent = self._make_agent()
+        agent.settings.MAX_CONVERSATION_MESSAGES = 0
+        agent._append_message(Message(role=MessageRole.USER, content="hi"))
+        agent._call_llm(include_tools=False)
+        sent = mock_litellm.completion.call_args.kwargs["messages"]
+        sent[1]["content"] = "edited by provider"
+        assert agent.messages[1].to_dict()["content"] == "hi"
+
     def test_import_empty_history(self):
         agent = self._make_agent()
         agent.import_history([])
@@ -132,12 +265,33 @@ class TestManagerAgent:
         assert history[0]["content"].endswith("...")
         assert len(history[0]["content"]) < 300
 
+    def test_get_history_preview_boundary_and_tool_flag(self):
+        agent = self._make_agent()
+        agent.messages.append(Message(role=MessageRole.USER, content="y" * 200))
+        agent.messages.append(Message(
+            role=MessageRole.ASSISTANT, content="", tool_calls=[{"id": "1"}],
+        ))
+        history = agent.get_history()
+        assert history[0]["content"] == "y" * 200
+        assert history[0]["has_tool_calls"] is False
+        assert history[1]["has_tool_calls"] is True
+
+    def test_history_dicts_are_cached_per_message(self):
+        agent = self._make_agent()
+        agent.messages.append(Message(role=MessageRole.USER, content="z" * 300))
+        first, again = agent.get_history(), agent.get_history()
+        assert first[0] is again[0]
+        full = agent.get_full_history()
+        assert full[0] is agent.get_full_history()[0]
+        assert full[0]["content"] == "z" * 300
+        assert first[0]["content"] == "z" * 200 + "..."
 
 class TestLiteLLMRouting:
     """Tests for LiteLLM-based unified LLM routing."""
 
     def _make_agent(self):
         settings = MagicMock()
+        settings.WORKER_CACHE_TTL = 0
         settings.ORCHESTRATOR_MODEL = "test-model"
         settings.ORCHESTRATOR_API_BASE = "http://localhost:8045"
         settings.ORCHESTRATOR_API_KEY = "sk-test"
@@ -160,6 +314,7 @@ class TestLiteLLMRouting:
         mock_litellm.completion.return_value = mock_resp
 
         settings = MagicMock()
+        settings.WORKER_CACHE_TTL = 0
         settings.get_manager_config.return_value = {
             "model": "claude-opus-4",
             "api_base": "http://localhost:8045",
@@ -177,6 +332,44 @@ class TestLiteLLMRouting:
         assert call_kwargs.kwargs["api_base"] == "http://localhost:8045"
         assert call_kwargs.kwargs["api_key"] == "sk-test"
 
+    @patch("src.core.manager.litellm")
+    def test_call_llm_marks_system_prefix_for_anthropic_cache(self, mock_litellm):
+        import hashlib
+        import json
+        settings = MagicMock()
+        settings.WORKER_CACHE_TTL = 0
+        settings.get_manager_config.return_value = {
+            "model": "claude-opus-4",
+            "api_base": "http://localhost:8045",
+            "api_key": "sk-test",
+        }
+        agent = ManagerAgent(settings=settings)
+
+        agent._call_llm(include_tools=False)
+        agent.messages.append(Message(role=MessageRole.USER, content="next turn"))
+        agent._call_llm(include_tools=False)
+
+        first, second = (c.kwargs["messages"][0] for c in mock_litellm.completion.call_args_list)
+        assert first["content"][0]["cache_control"] == {"type": "ephemeral"}
+        # Fresh copies per call, with a byte-identical prefix
+        assert first is not second
+        digest = lambda d: hashlib.sha256(json.dumps(d, sort_keys=True).encode()).hexdigest()
+        assert digest(first) == digest(second)
+
+    @patch("src.core.manager.litellm")
+    def test_call_llm_plain_system_for_non_anthropic(self, mock_litellm):
+        settings = MagicMock()
+        settings.WORKER_CACHE_TTL = 0
+        settings.get_manager_config.return_value = {
+            "model": "gpt-4o",
+            "api_base": "http://localhost:8045",
+            "api_key": "sk-test",
+        }
+        agent = ManagerAgent(settings=settings)
+        agent._call_llm(include_tools=False)
+        system = mock_litellm.completion.call_args.kwargs["messages"][0]
+        assert isinstance(system["content"], str)
+
     @patch("src.core.manager.litellm")
     def test_call_llm_openai_provider(self, mock_litellm):
         """OpenAI models should get custom_llm_provider='openai'."""
@@ -187,6 +380,7 @@ class TestLiteLLMRouting:
         mock_litellm.completion.return_value = mock_resp
 
         settings = MagicMock()
+        settings.WORKER_CACHE_TTL = 0
         settings.get_manager_config.return_value = {
             "model": "gpt-4o",
             "api_base": "http://localhost:8045",
@@ -211,6 +405,7 @@ class TestLiteLLMRouting:
         mock_litellm.completion.return_value = mock_resp
 
         settings = MagicMock()
+        settings.WORKER_CACHE_TTL = 0
         settings.get_manager_config.return_value = {
             "model": "claude-opus-4-6-thinking",
             "api_base": "http://localhost:8045",
@@ -268,6 +463,7 @@ class TestLiteLLMRouting:
         mock_litellm.completion.return_value = mock_resp
 
         settings = MagicMock()
+        settings.WORKER_CACHE_TTL = 0
         settings.get_manager_config.return_value = {
             "model": "anthropic/claude-opus-4",
             "api_base": "http://localhost:8045",
@@ -291,6 +487,7 @@ class TestLiteLLMRouting:
     def test_build_worker_tools_sanitized_names(self):
         """Tool names should be sanitized for API compatibility."""
         settings = MagicMock()
+        settings.WORKER_CACHE_TTL = 0
         settings.ORCHESTRATOR_MODEL = "test-model"
         settings.get_manager_config.return_value = {
             "model": "test-model", "api_base": "http://test", "api_key": "k"
@@ -309,6 +506,26 @@ class TestLiteLLMRouting:
         tools = agent._build_worker_tools()
         assert len(tools) == 1
 
+    def test_build_all_tools_identity_stable(self):
+        settings = MagicMock()
+        settings.WORKER_CACHE_TTL = 0
+        settings.get_manager_config.return_value = {
+            "model": "test-model", "api_base": "http://test", "api_key": "k"
+        }
+        mock_registry = MagicMock()
+        wc = MagicMock()
+        wc.name, wc.model, wc.profile = "coder", "m1", "live"
+        mock_registry.get_active_workers.return_value = [wc]
+
+        agent = ManagerAgent(settings=settings, worker_registry=mock_registry)
+        tools = agent._build_all_tools()
+        assert agent._build_all_tools() is tools
+
+        wc.model = "m2"
+        rebuilt = agent._build_all_tools()
+        assert rebuilt is not tools
+        assert "m2" in rebuilt[0]["function"]["description"]
+
 
 class TestManagerCommandHandlers:
     """Tests for manager command handlers in engine.py."""
@@ -316,6 +533,7 @@ class TestManagerCommandHandlers:
     def _make_engine(self):
         from src.core.engine import SessionEngine
         settings = MagicMock()
+        settings.WORKER_CACHE_TTL = 0
         settings.MANAGER_PROFILE = "default"
         settings.MANAGER_MODEL_OVERRIDE = ""
         settings.MANAGER_API_BASE_OVERRIDE = ""
@@ -395,6 +613,7 @@ class TestTabCompletion:
         from unittest.mock import MagicMock
         
         settings = MagicMock()
+        settings.WORKER_CACHE_TTL = 0
         settings.MANAGER_PROFILE = "default"
         settings.get_manager_config.return_value = {
             "model": "gpt-4o",
@@ -415,6 +634,7 @@ class TestTabCompletion:
         from src.core.engine import SessionEngine
         
         settings = MagicMock()
+        settings.WORKER_CACHE_TTL = 0
         settings.MANAGER_PROFILE = "default"
         settings.get_manager_config.return_value = {}
         
@@ -430,6 +650,7 @@ class TestTabCompletion:
         from src.core.engine import SessionEngine
         
         settings = MagicMock()
+        settings.WORKER_CACHE_TTL = 0
         settings.MANAGER_PROFILE = "default"
         settings.get_manager_config.return_value = {}
         
@@ -449,6 +670,7 @@ class TestSessionVsGlobalConfig:
         from src.core.engine import SessionEngine
         
         settings = MagicMock()
+        settings.WORKER_CACHE_TTL = 0
         settings.MANAGER_PROFILE = "default"
         settings.get_manager_config.return_value = {
             "model": "gpt-4o",
@@ -467,6 +689,7 @@ class TestSessionVsGlobalConfig:
         from src.core.engine import SessionEngine
         
         settings = MagicMock()
+        settings.WORKER_CACHE_TTL = 0
         settings.MANAGER_PROFILE = "default"
         settings.get_manager_config.return_value = {
             "model": "gpt-4o",
@@ -486,6 +709,7 @@ class TestSessionVsGlobalConfig:
         from src.core.engine import SessionEngine
         
         settings = MagicMock()
+        settings.WORKER_CACHE_TTL = 0
         settings.MANAGER_PROFILE = "default"
         settings.MANAGER_MODEL_OVERRIDE = ""  # Start empty
         settings.ORCHESTRATOR_MODEL = "gpt-4o"
@@ -516,6 +740,7 @@ class TestBugFixes:
         from src.core.engine import SessionEngine
         
         settings = MagicMock()
+        settings.WORKER_CACHE_TTL = 0
         settings.MANAGER_PROFILE = "default"
         settings.get_manager_config.return_value = {}
         
@@ -531,6 +756,7 @@ class TestBugFixes:
         from src.core.engine import SessionEngine
         
         settings = MagicMock()
+        settings.WORKER_CACHE_TTL = 0
         settings.MANAGER_PROFILE = "default"
         settings.get_manager_config.return_value = {
             "model": "gpt-4o",
@@ -558,6 +784,7 @@ class TestBugFixes:
         from src.core.engine import SessionEngine
         
         settings = MagicMock()
+        settings.WORKER_CACHE_TTL = 0
         settings.MANAGER_PROFILE = "default"
         settings.get_manager_config.return_value = {
             "model": "gpt-4o",
@@ -584,3 +811,76 @@ class TestBugFixes:
         assert api_base == "https://api.z.ai/api/paas/v4/"
 
 
+class TestToolCallCache:
+    """Tests for caching of repeated Worker delegations."""
+
+    def _result(self, status=TaskStatus.SUCCESS):
+        return TaskResult(status=status, exit_code=0, output_lines=["done"])
+
+    def _make_agent(self, ttl):
+        settings = MagicMock()
+        settings.WORKER_MODEL = "test-model"
+        settings.WORKER_PROFILE = "live"
+        settings.AGENT_PATH = "../test"
+        settings.WORKER_CACHE_TTL = ttl
+        agent = ManagerAgent(settings=settings)
+        agent.worker = MagicMock()
+        agent.worker.run_task.return_value = self._result()
+        return agent
+
+    def test_key_depends_on_task_and_target(self):
+        key = ToolCallCache.make_key("task", "ctx", "model", "live")
+        assert key == ToolCallCache.make_key("task", "ctx", "model", "live")
+        assert key != ToolCallCache.make_key("task", "ctx", "other-model", "live")
+        assert key != ToolCallCache.make_key("task", "", "model", "live")
+
+    def test_only_successful_results_are_cached(self):
+        cache = ToolCallCache(ttl_seconds=60)
+        cache.put("fail", self._result(TaskStatus.FAILED))
+        cache.put("ok", self._result())
+        assert cache.get("fail") is None
+        assert cache.get("ok") is not None
+
+    def test_lru_eviction_and_ttl(self):
+        cache = ToolCallCache(max_entries=2, ttl_seconds=60)
+        for key in ("a", "b", "c"):
+            cache.put(key, self._result())
+        assert cache.get("a") is None
+        assert len(cache) == 2
+
+        with patch("src.core.manager.time.monotonic", return_value=10**9):
+            assert cache.get("b") is None
+
+    def test_repeated_delegation_reuses_result(self):
+        agent = self._make_agent(ttl=300)
+        first = agent._execute_worker_task("Fix the bug", "ctx")
+        second = agent._execute_worker_task("Fix the bug", "ctx")
+        assert second is first
+        assert agent.worker.run_task.call_count == 1
+
+        agent.clear_cache()
+        agent._execute_worker_task("Fix the bug", "ctx")
+        assert agent.worker.run_task.call_count == 2
+
+    def test_new_conversation_drops_cached_results(self):
+        agent = self._make_agent(ttl=300)
+        agent._execute_worker_task("Fix the bug")
+        agent.clear_history()
+        agent._execute_worker_task("Fix the bug")
+        agent.import_history([])
+        agent._execute_worker_task("Fix the bug")
+        assert agent.worker.run_task.call_count == 3
+
+    def test_cache_hit_still_asks_for_confirmation(self):
+        agent = self._make_agent(ttl=300)
+        agent._execute_worker_task("Fix the bug")
+        agent._confirm_before_worker = MagicMock(return_value=False)
+        result = agent._execute_worker_task("Fix the bug")
+        assert result.status == TaskStatus.CANCELLED
+        agent._confirm_before_worker.assert_called_once_with("Fix the bug")
+
+    def test_cache_disabled_by_default_ttl(self):
+        agent = self._make_agent(ttl=0)
+        agent._execute_worker_task("Fix the bug")
+        agent._execute_worker_task("Fix the bug")
+        assert agent.worker.run_task.call_count == 2
@@ -1,6 +1,10 @@
 """Tests for the log parser module."""
 
+import json
+from unittest.mock import MagicMock, patch
+
 import pytest
+from src.utils import parser as parser_mod
 from src.utils.parser import (
     AgentLogEntry,
     RawLogEntry,
@@ -10,6 +14,15 @@ from src.utils.parser import (
 )
 
 
+@pytest.fixture
+def stdlib_only(monkeypatch):
+    """Parse as without orjson installed (the log templates are only used then)."""
+    monkeypatch.setattr(parser_mod, "orjson", None)
+    parser_mod._parse_json_line.cache_clear()
+    yield
+    parser_mod._parse_json_line.cache_clear()
+
+
 class TestParseLogLine:
     """Tests for parse_log_line function."""
 
@@ -21,6 +34,29 @@ class TestParseLogLine:
         assert entry.step_number == 1
         assert entry.message == "Starting..."
 
+    @pytest.mark.parametrize("line", [
+        b'{"type": "step", "step": 1, "message": "caf\xc3\xa9"}',
+        bytearray(b'{"type": "step", "step": 1, "message": "caf\xc3\xa9"}'),
+    ])
+    def test_bytes_input(self, line):
+        entry = parse_log_line(line)
+        assert isinstance(entry, AgentLogEntry)
+        assert entry.message == "café"
+        assert entry.raw == '{"type": "step", "step": 1, "message": "café"}'
+
+    def test_str_subclass_and_non_string_input(self):
+        class Line(str):
+            def strip(self, *args):
+                raise ValueError("bad strip")
+
+        assert parse_log_line(Line('{"type": "step"}')).raw == '{"type": "step"}'
+        assert parse_log_line(42) == RawLogEntry(raw="42")
+
+    def test_invalid_utf8_bytes_become_raw_text(self):
+        entry = parse_log_line(b"plain \xff output")
+        assert isinstance(entry, RawLogEntry)
+        assert entry.raw == "plain \ufffd output"
+
     def test_valid_cost_log(self):
         line = '{"type": "cost", "total": 0.0025}'
         entry = parse_log_line(line)
@@ -57,6 +93,23 @@ class TestParseLogLine:
         entry = parse_log_line("   ")
         assert isinstance(entry, RawLogEntry)
 
+    @pytest.mark.parametrize("line", [
+        "", "   ", "plain text", '[{"type": "step"}]', " {no type key}", '{"type": "step", "step": 1',
+    ])
+    def test_non_log_lines_skip_json_decode(self, line):
+        with patch.object(parser_mod, "_loads") as loads:
+            entry = parse_log_line(line)
+        loads.assert_not_called()
+        assert isinstance(entry, RawLogEntry)
+        assert entry.raw == line
+
+    def test_escaped_type_key_still_decoded(self):
+        line = '{"\\u0074ype": "step", "step": 3, "message": "escaped"}'
+        entry = parse_log_line(line)
+        assert isinstance(entry, AgentLogEntry)
+        assert entry.is_step
+        assert entry.step_number == 3
+
     def test_json_without_type_field(self):
         line = '{"key": "value"}'
         entry = parse_log_line(line)
@@ -87,6 +140,120 @@ class TestParseLogLine:
         entry = parse_log_line(line)
         assert entry.cost == 0.005
 
+    def test_entry_fields_precomputed_and_frozen(self):
+        import dataclasses
+        entry = AgentLogEntry(log_type="step", data={"step": 3, "content": "Reading"}, raw="")
+        assert (entry.is_step, entry.is_cost, entry.step_number, entry.message, entry.cost) == (
+            True, False, 3, "Reading", None,
+        )
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            entry.log_type = "cost"
+
+    def test_repeated_json_lines_reuse_the_entry(self):
+        line = '{"type": "step", "step": 7, "message": "again"}'
+        first = parse_log_line(line)
+        with patch.object(parser_mod, "_loads") as loads:
+            assert parse_log_line(line) is first
+            assert parse_log_line(line.encode()) is first
+        loads.assert_not_called()
+        assert parse_log_line(line + " ") is not first
+
+    @pytest.mark.parametrize("line", [
+        '{"type": "cost", "cost": 3}',
+        '{"type": "cost", "total": 1E400}',
+        '{"type": "step", "step": 2, "message": "say \\"hi\\""}',
+        '{"type": "step", "data": {"step": 1, "action": "ls"}}',
+    ])
+    def test_entry_data_is_the_decoded_json(self, line):
+        entry = parse_log_line(line)
+        assert entry == AgentLogEntry(log_type=json.loads(line)["type"], data=json.loads(line), raw=line)
+
+    _TEMPLATE_LINES = [
+        '{"type": "step", "step": 1, "message": "Starting..."}',
+        '{"type":"step","step":12,"content":"çalışıyor"}',
+        '{"type": "step", "step": 2, "message": "say \\"hi\\""}',
+        '{"type": "step", "message": "no step number"}',
+        '{"type": "result", "message": "Task completed"}',
+        '{"type": "error", "content": ""}',
+        '{"type": "error", "message": "x", "code": 1}',
+    ]
+
+    @pytest.mark.parametrize("line", _TEMPLATE_LINES)
+    def test_templates_match_the_decoder(self, line, stdlib_only):
+        with patch.object(parser_mod, "_TEMPLATES", {}):
+            decoded = parse_log_line(line)
+        parser_mod._parse_json_line.cache_clear()
+        templated = parse_log_line(line)
+        assert templated == decoded
+        assert list(templated.data.items()) == list(decoded.data.items())
+
+    def test_step_template_skips_json_decode(self, stdlib_only):
+        with patch.object(parser_mod, "_loads") as loads:
+            entry = parse_log_line('{"type": "step", "step": 4, "message": "Editing"}')
+        loads.assert_not_called()
+        assert (entry.step_number, entry.message) == (4, "Editing")
+
+    def test_templates_unused_with_orjson(self):
+        if parser_mod.orjson is None:
+            pytest.skip("orjson not installed")
+        parser_mod._parse_json_line.cache_clear()
+        with patch.object(parser_mod, "_TEMPLATES") as templates:
+            entry = parse_log_line('{"type": "step", "step": 4, "message": "Editing"}')
+        templates.get.assert_not_called()
+        assert (entry.step_number, entry.message) == (4, "Editing")
+
+    @pytest.mark.parametrize("line,tried", [
+        ('{"type": "info", "message": "x"}', 0),
+        ('{"type": "cost", "total": 0.0025}', 0),
+        ('{"message": "x", "type": "step"}', 0),
+        ('{"type": "step", "data": {"step": 1}}', 1),
+        ('{"type":"error","message":"x","code":1}', 1),
+    ])
+    def test_at_most_one_template_is_tried(self, line, tried, stdlib_only):
+        pattern = MagicMock()
+        pattern.fullmatch.return_value = None
+        templates = dict.fromkeys(parser_mod._TEMPLATES, (pattern, None))
+        with patch.object(parser_mod, "_TEMPLATES", templates):
+            entry = parse_log_line(line)
+        assert pattern.fullmatch.call_count == tried
+        assert entry.data == json.loads(line)
+
+    @pytest.mark.parametrize("log_type,flags", [
+        ("step", (True, False, False, False)),
+        ("result", (False, True, False, False)),
+        ("cost", (False, False, True, False)),
+        ("error", (False, False, False, True)),
+        ("status", (False, False, False, False)),
+    ])
+    def test_type_flags(self, log_type, flags):
+        entry = parse_log_line('{"type": "%s"}' % log_type)
+        assert (entry.is_step, entry.is_result, entry.is_cost, entry.is_error) == flags
+
+    def test_known_log_types_are_interned(self):
+        import sys
+        entries = [parse_log_line('{"type": "step", "step": %d}' % i) for i in range(3)]
+        assert all(e.log_type is sys.intern("step") for e in entries)
+        assert parse_log_line('{"type": "custom"}').log_type == "custom"
+
+    def test_raw_entry_slotted_and_frozen(self):
+        import dataclasses
+        entry = parse_log_line("plain")
+        assert not hasattr(entry, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            entry.raw = "other"
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_same_result_with_and_without_orjson(self, use_orjson):
+        backend = parser_mod.orjson if use_orjson else None
+        if use_orjson and backend is None:
+            pytest.skip("orjson not installed")
+        parser_mod._parse_json_line.cache_clear()
+        with patch.object(parser_mod, "orjson", backend):
+            entry = parse_log_line('{"type": "cost", "total": NaN, "big": 123456789012345678901234567890}')
+            assert isinstance(entry, AgentLogEntry)
+            assert entry.data["big"] == 123456789012345678901234567890
+            assert isinstance(parse_log_line('{"type": broken'), RawLogEntry)
+
 
 class TestSafeString:
     """Tests for safe_string function."""
@@ -104,6 +271,16 @@ class TestSafeString:
         result = safe_string("Hello \u00e7al\u0131\u015f\u0131yor")
         assert "\u00e7al\u0131\u015f\u0131yor" in result
 
+    def test_lone_surrogate_replaced(self):
+        assert safe_string("bad \udcff byte") == "bad ? byte"
+
+    def test_truncation_with_unicode_and_surrogates(self):
+        assert safe_string("ç\udcff" + "ş" * 50, max_length=4) == "ç?şş..."
+        assert safe_string("\udcff" * 3, max_length=3) == "???"
+
+    def test_non_string_input(self):
+        assert safe_string(None) == "<unparseable content>"
+
 
 class TestFormatLogEntry:
     """Tests for format_log_entry function."""
@@ -145,3 +322,10 @@ class TestFormatLogEntry:
             raw="",
         )
         assert "[Error]" in format_log_entry(entry)
+
+    def test_format_defaults_and_generic(self):
+        assert format_log_entry(parse_log_line('{"type": "step"}')) == "[Step ?] Processing..."
+        assert format_log_entry(parse_log_line('{"type": "cost"}')) == "[Cost] Unknown"
+        assert format_log_entry(parse_log_line('{"type": "result"}')) == "[Result] Completed"
+        assert format_log_entry(parse_log_line('{"type": "error"}')) == "[Error] Unknown error"
+        assert format_log_entry(parse_log_line('{"type": "info", "n": 1}')) == '[info] {"type": "info", "n": 1}'
@@ -6,7 +6,14 @@ from unittest.mock import MagicMock, patch, PropertyMock
 
 import pytest
 
-from src.core.worker import AgentWorker, TaskResult, TaskStatus, _NOISE_PATTERNS
+from src.core.worker import AgentWorker, TaskResult, TaskStatus, _NOISE_PATTERNS, _iter_pipe_lines, _uv_cache_dir
+
+
+@pytest.fixture(autouse=True)
+def _no_uv_lookup():
+    """Keep _build_env() from running a real `uv cache dir` subprocess."""
+    with patch("src.core.worker._uv_cache_dir", return_value=None):
+        yield
 
 
 class TestBuildCommand:
@@ -44,7 +51,7 @@ class TestBuildEnv:
 
     def test_only_allowlisted_vars(self):
         settings = MagicMock()
-        settings.get_agent_env.return_value = {"MINI_API_BASE": "http://localhost"}
+        settings.agent_env = {"MINI_API_BASE": "http://localhost"}
         worker = AgentWorker(settings=settings)
         with patch.dict("os.environ", {"PATH": "/usr/bin", "SECRET_KEY": "should-not-pass", "HOME": "/home/user"}, clear=True):
             env = worker._build_env()
@@ -56,7 +63,7 @@ class TestBuildEnv:
 
     def test_api_overrides(self):
         settings = MagicMock()
-        settings.get_agent_env.return_value = {}
+        settings.agent_env = {}
         worker = AgentWorker(settings=settings)
         with patch.dict("os.environ", {"PATH": "/usr/bin"}, clear=True):
             env = worker._build_env(api_base_override="https://api.z.ai/v1/", api_key_override="sk-test")
@@ -65,13 +72,59 @@ class TestBuildEnv:
 
     def test_no_api_overrides(self):
         settings = MagicMock()
-        settings.get_agent_env.return_value = {}
+        settings.agent_env = {}
         worker = AgentWorker(settings=settings)
         with patch.dict("os.environ", {"PATH": "/usr/bin"}, clear=True):
             env = worker._build_env()
         assert "MINI_API_BASE" not in env
         assert "MINI_API_KEY" not in env
 
+    def test_base_env_reused_until_agent_env_changes(self):
+        settings = MagicMock()
+        settings.agent_env = {"MINI_API_BASE": "http://a"}
+        worker = AgentWorker(settings=settings)
+        with patch.dict("os.environ", {"PATH": "/usr/bin"}, clear=True):
+            first = worker._build_env()
+            assert worker._build_env() is first
+            overridden = worker._build_env(api_key_override="sk-test")
+            assert overridden is not first
+            assert "MINI_API_KEY" not in first
+            settings.agent_env = {"MINI_API_BASE": "http://b"}
+            rebuilt = worker._build_env()
+        assert rebuilt is not first
+        assert rebuilt["MINI_API_BASE"] == "http://b"
+
+    def test_pins_uv_cache_dir(self):
+        settings = MagicMock()
+        settings.agent_env = {}
+        worker = AgentWorker(settings=settings)
+        with patch("src.core.worker._uv_cache_dir", return_value="/cache/uv"), \
+                patch.dict("os.environ", {"PATH": "/usr/bin"}, clear=True):
+            env = worker._build_env()
+        assert env["UV_CACHE_DIR"] == "/cache/uv"
+
+    def test_user_uv_cache_dir_kept(self):
+        settings = MagicMock()
+        settings.agent_env = {}
+        worker = AgentWorker(settings=settings)
+        with patch("src.core.worker._uv_cache_dir") as lookup, \
+                patch.dict("os.environ", {"PATH": "/usr/bin", "UV_CACHE_DIR": "/mine"}, clear=True):
+            env = worker._build_env()
+        assert env["UV_CACHE_DIR"] == "/mine"
+        lookup.assert_not_called()
+
+    def test_uv_cache_dir_resolved_once(self):
+        # The module-level name is patched by _no_uv_lookup; exercise the real function
+        done = subprocess.CompletedProcess(args=[], returncode=0, stdout="/cache/uv\n")
+        _uv_cache_dir.cache_clear()
+        try:
+            with patch("src.core.worker.subprocess.run", return_value=done) as run:
+                assert _uv_cache_dir() == "/cache/uv"
+                assert _uv_cache_dir() == "/cache/uv"
+            run.assert_called_once()
+        finally:
+            _uv_cache_dir.cache_clear()
+
 
 class TestIsNoiseLine:
     """Tests for AgentWorker._is_noise_line() filtering."""
@@ -93,6 +146,52 @@ class TestIsNoiseLine:
         assert AgentWorker._is_noise_line(ansi_line) is True
 
 
+class TestIterPipeLines:
+    """Tests for the binary pipe line reader used by AgentWorker.run()."""
+
+    def _lines(self, payload: bytes) -> list[str]:
+        import os
+        import threading
+
+        read_fd, write_fd = os.pipe()
+
+        def _writer():
+            with open(write_fd, "wb") as f:
+                f.write(payload)
+
+        # Write from a thread: payloads may exceed the OS pipe buffer
+        writer = threading.Thread(target=_writer)
+        writer.start()
+        with open(read_fd, "rb", buffering=0) as pipe:
+            lines = list(_iter_pipe_lines(pipe))
+        writer.join()
+        return lines
+
+    def test_splits_like_universal_newlines(self):
+        assert self._lines(b"a\r\n\nb\rc\nlast") == ["a", "", "b", "c", "last"]
+
+    def test_decodes_utf8_with_replacement(self):
+        assert self._lines("çalış\n".encode("utf-8") + b"\xff\n") == ["çalış", "\ufffd"]
+
+    def test_line_spanning_reads(self):
+        long_line = b"x" * (200 * 1024)
+        assert self._lines(long_line + b"\nend\n") == [long_line.decode(), "end"]
+
+    def test_deadline_on_silent_pipe(self):
+        import os
+        import time
+
+        read_fd, write_fd = os.pipe()
+        try:
+            with open(read_fd, "rb", buffering=0) as pipe:
+                start = time.monotonic()
+                with pytest.raises(TimeoutError):
+                    list(_iter_pipe_lines(pipe, deadline=start + 0.1))
+                assert time.monotonic() - start < 2
+        finally:
+            os.close(write_fd)
+
+
 class TestTerminateProcess:
     """Tests for AgentWorker._terminate_process()."""
 
@@ -163,6 +262,7 @@ class TestRunTask:
 
     def test_file_not_found_error(self):
         settings = MagicMock()
+        settings.WORKER_MAX_KEPT_LINES = 1000
         settings.WORKER_PROFILE = "live"
         settings.WORKER_TIMEOUT = 600
         settings.agent_path_resolved = Path("/nonexistent/path")
@@ -174,6 +274,7 @@ class TestRunTask:
 
     def test_keyboard_interrupt(self):
         settings = MagicMock()
+        settings.WORKER_MAX_KEPT_LINES = 1000
         settings.WORKER_PROFILE = "live"
         settings.WORKER_TIMEOUT = 600
         settings.agent_path_resolved = MagicMock()
@@ -186,6 +287,7 @@ class TestRunTask:
 
     def test_runtime_error(self):
         settings = MagicMock()
+        settings.WORKER_MAX_KEPT_LINES = 1000
         settings.WORKER_PROFILE = "live"
         settings.WORKER_TIMEOUT = 600
         settings.agent_path_resolved = MagicMock()
@@ -196,6 +298,64 @@ class TestRunTask:
         assert result.status == TaskStatus.FAILED
         assert "uv not installed" in result.error_message
 
+    def test_extracts_step_and_cost_metrics(self):
+        settings = MagicMock()
+        settings.WORKER_PROFILE = "live"
+        settings.WORKER_TIMEOUT = 600
+        settings.WORKER_MAX_KEPT_LINES = 1000
+        worker = AgentWorker(settings=settings)
+
+        def fake_run(*args, **kwargs):
+            yield '{"type": "step", "step": 1, "message": "Reading"}'
+            yield "plain text mentioning step and cost"
+            yield '{"type": "step", "step": 2}'
+            yield '{"type": "cost", "total": 0.25}'
+            yield '{"type": "result", "message": "done"}'
+            return 0
+
+        with patch.object(worker, "run", side_effect=fake_run):
+            result = worker.run_task("test task", "model")
+        assert result.status == TaskStatus.SUCCESS
+        assert result.step_count == 2
+        assert result.total_cost == 0.25
+        assert len(result.output_lines) == 5
+
+    def test_output_lines_keep_only_recent_tail(self):
+        settings = MagicMock()
+        settings.WORKER_PROFILE = "live"
+        settings.WORKER_TIMEOUT = 600
+        settings.WORKER_MAX_KEPT_LINES = 3
+        worker = AgentWorker(settings=settings)
+
+        def fake_run(*args, **kwargs):
+            for i in range(10):
+                yield f"line {i}"
+            return 0
+
+        with patch.object(worker, "run", side_effect=fake_run):
+            result = worker.run_task("test task", "model")
+        assert list(result.output_lines) == ["line 7", "line 8", "line 9"]
+        assert result.output_text == "line 7\nline 8\nline 9"
+
+    def test_silent_worker_times_out(self, tmp_path):
+        import sys
+        import time
+
+        settings = MagicMock()
+        settings.WORKER_TIMEOUT = 0.3
+        settings.WORKER_MAX_KEPT_LINES = 1000
+        settings.agent_env = {}
+        settings.agent_path_resolved = tmp_path
+        worker = AgentWorker(settings=settings)
+        silent = [sys.executable, "-c", "import time; time.sleep(30)"]
+        start = time.monotonic()
+        with patch.object(worker, "_build_command", return_value=silent):
+            result = worker.run_task("test task", "model")
+        assert time.monotonic() - start < 10
+        assert result.status == TaskStatus.FAILED
+        assert result.exit_code == -2
+        assert "timed out" in result.error_message
+
 
 class TestTaskStatus:
     """Tests for TaskStatus enum."""